@@ -6,27 +6,47 @@ Entrypoint for running the FastAPI application via `python -m uca_orchestrator.a
 Responsibilities:
 - Load settings.
 - Create the app.
-- Start uvicorn with structlog-compatible logging config.
+- Start uvicorn (uvloop/httptools, optional multi-worker) with structlog-compatible logging config.
 """
 
 from __future__ import annotations
 
+from typing import Any
+
 import uvicorn
+from fastapi import FastAPI
 
 from uca_orchestrator.api.app import create_app
 from uca_orchestrator.settings import get_settings
 
 
+def app_factory() -> FastAPI:
+    # Import-string target for multi-worker mode: each worker process builds its own app.
+    return create_app(settings=get_settings())
+
+
 def main() -> None:
     settings = get_settings()
-    app = create_app(settings=settings)
-
-    uvicorn.run(
-        app,
-        host=settings.api_host,
-        port=settings.api_port,
-        log_config=None,  # structlog
-    )
+    server_kwargs: dict[str, Any] = {
+        "host": settings.api_host,
+        "port": settings.api_port,
+        "log_config": None,  # structlog
+        # uvloop + httptools (both from uvicorn[standard]) instead of asyncio/h11 defaults.
+        "loop": "uvloop",
+        "http": "httptools",
+    }
+
+    if settings.api_workers > 1:
+        # Uvicorn can only fork workers from an import string, not an app instance.
+        uvicorn.run(
+            "uca_orchestrator.api.__main__:app_factory",
+            factory=True,
+            workers=settings.api_workers,
+            **server_kwargs,
+        )
+        return
+
+    uvicorn.run(create_app(settings=settings), **server_kwargs)
 
 
 if __name__ == "__main__":
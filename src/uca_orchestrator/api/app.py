@@ -11,6 +11,9 @@ Responsibilities:
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack, asynccontextmanager
+
 from fastapi import FastAPI
 
 from uca_orchestrator.api.routers.dev_auth import router as dev_auth_router
@@ -19,7 +22,8 @@ from uca_orchestrator.api.routers.internal.router import router as internal_rout
 from uca_orchestrator.api.routers.runs import router as runs_router
 from uca_orchestrator.api.routers.use_cases import router as use_cases_router
 from uca_orchestrator.db.init_db import init_db
-from uca_orchestrator.db.session import create_engine, create_sessionmaker
+from uca_orchestrator.db.session import create_engine, create_sessionmaker, warm_pool
+from uca_orchestrator.governance_clients.in_process import InProcessApiClient
 from uca_orchestrator.observability.logging import configure_logging, get_logger
 from uca_orchestrator.observability.middleware import RequestContextMiddleware
 from uca_orchestrator.settings import Settings
@@ -29,14 +33,65 @@ log = get_logger(__name__)
 
 def create_app(*, settings: Settings) -> FastAPI:
     # Configure structured logging once at process startup (before app serves requests).
-    configure_logging(service_name=settings.service_name, level=settings.log_level)
+    # Records emitted before the lifespan starts the listener are buffered in its queue.
+    log_listener = configure_logging(service_name=settings.service_name, level=settings.log_level)
+
+    @asynccontextmanager
+    async def _logging_lifespan(app: FastAPI) -> AsyncIterator[None]:
+        log_listener.start()
+        try:
+            yield
+        finally:
+            # Stopping drains the queue so shutdown logs are not lost.
+            log_listener.stop()
+
+    @asynccontextmanager
+    async def _infra_lifespan(app: FastAPI) -> AsyncIterator[None]:
+        log.info("startup", env=settings.env)
+        # Create the async DB engine and session factory once and stash them on app.state.
+        # Routers obtain sessions via dependencies (see `uca_orchestrator.api.deps`).
+        engine = create_engine(settings)
+        app.state.engine = engine
+        app.state.sessionmaker = create_sessionmaker(engine)
+        # One governance client for the process: it only holds the sessionmaker, and each
+        # tool call opens its own session.
+        app.state.governance_client = InProcessApiClient(sessionmaker=app.state.sessionmaker)
+        try:
+            if settings.env in ("dev", "test"):
+                # Dev/test convenience: create tables automatically. Prod should use Alembic migrations.
+                await init_db(engine)
+            try:
+                await warm_pool(engine, settings.db_pool_size)
+            except Exception as e:
+                # Warm-up is only an optimisation: an unreachable DB must not block startup;
+                # requests surface the error (and /readyz reports it) instead.
+                log.warning("db_pool_warmup_failed", error=str(e))
+            yield
+        finally:
+            # Dispose the engine to close pools/FDs gracefully.
+            await engine.dispose()
+            log.info("shutdown")
+
+    # Sub-app/exporter lifespans (e.g. MCP mounts, metrics) are appended after core infra so
+    # they can rely on the engine; AsyncExitStack unwinds them in reverse on shutdown.
+    lifespans = [_logging_lifespan, _infra_lifespan]
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        async with AsyncExitStack() as stack:
+            for ctx in lifespans:
+                await stack.enter_async_context(ctx(app))
+            yield
 
     app = FastAPI(
         title="Use Case Approval Orchestrator Agent",
         version="0.1.0",
         docs_url="/docs",
         openapi_url="/openapi.json",
+        lifespan=lifespan,
     )
+    # Request handlers read settings from here (`settings.settings_dep`).
+    app.state.settings = settings
 
     app.add_middleware(RequestContextMiddleware)
     app.include_router(health_router, tags=["health"])
@@ -45,26 +100,6 @@ def create_app(*, settings: Settings) -> FastAPI:
     app.include_router(use_cases_router)
     app.include_router(runs_router)
 
-    @app.on_event("startup")
-    async def _startup() -> None:
-        log.info("startup", env=settings.env)
-        # Create the async DB engine and session factory once and stash them on app.state.
-        # Routers obtain sessions via dependencies (see `uca_orchestrator.api.deps`).
-        engine = create_engine(settings)
-        app.state.engine = engine
-        app.state.sessionmaker = create_sessionmaker(engine)
-        if settings.env in ("dev", "test"):
-            # Dev/test convenience: create tables automatically. Prod should use Alembic migrations.
-            await init_db(engine)
-
-    @app.on_event("shutdown")
-    async def _shutdown() -> None:
-        # Dispose the engine to close pools/FDs gracefully.
-        engine = getattr(app.state, "engine", None)
-        if engine is not None:
-            await engine.dispose()
-        log.info("shutdown")
-
     return app
 
 
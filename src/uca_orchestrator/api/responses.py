@@ -0,0 +1,33 @@
+"""
+uca_orchestrator.api.responses
+
+Custom response classes for the API layer.
+
+Responsibilities:
+- Serialize plain (non-Pydantic) payloads with orjson in a single C-level pass.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from starlette.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered by orjson.
+
+    Meant for handlers that build dict/list payloads themselves and return the response
+    directly, skipping FastAPI's response validation and encoding. orjson emits UUIDs and
+    datetimes natively (same text as `str()` / `.isoformat()` for naive UTC values).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+# --- Module Notes -----------------------------------------------------------
+# Endpoints that return Pydantic models keep `response_model`: FastAPI already dumps those
+# straight to JSON bytes via pydantic-core, which a custom response class would disable.
@@ -17,7 +17,7 @@ from pydantic import BaseModel, Field
 from starlette.status import HTTP_404_NOT_FOUND
 
 from uca_orchestrator.auth.jwt import JwtConfig, issue_token
-from uca_orchestrator.settings import Settings, get_settings
+from uca_orchestrator.settings import Settings, settings_dep
 
 router = APIRouter(prefix="/v1/dev", tags=["dev"])
 
@@ -33,15 +33,19 @@ class DevTokenResponse(BaseModel):
     token_type: str = "bearer"
 
 
-@router.post("/token", response_model=DevTokenResponse)
-async def mint_dev_token(
-    body: DevTokenRequest,
-    settings: Settings = Depends(get_settings),
-) -> DevTokenResponse:
+def _dev_only(settings: Settings = Depends(settings_dep)) -> None:
     # Security guardrail: never expose dev token minting in production.
+    # FastAPI resolves dependencies before validating the request body, so prod probes are
+    # rejected without paying for DevTokenRequest validation.
     if settings.env == "prod":
         raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="Not found")
 
+
+@router.post("/token", response_model=DevTokenResponse, dependencies=[Depends(_dev_only)])
+async def mint_dev_token(
+    body: DevTokenRequest,
+    settings: Settings = Depends(settings_dep),
+) -> DevTokenResponse:
     cfg = JwtConfig(
         alg=settings.jwt_alg,
         issuer=settings.jwt_issuer,
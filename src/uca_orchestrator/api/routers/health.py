@@ -10,26 +10,41 @@ Responsibilities:
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession
+from time import monotonic
 
-from uca_orchestrator.api.deps import db_session
+from fastapi import APIRouter, Request, Response
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
 
 router = APIRouter()
 
+# Successful DB pings are reused for this long so frequent probes don't hold pool slots.
+_READY_TTL_S = 2.0
+
+# Probe bodies never change, so they are encoded once. A fresh Response is still built per
+# request: FastAPI may attach per-request headers/background tasks to the object it returns.
+_OK_BODY = b'{"status":"ok"}'
+_READY_BODY = b'{"status":"ready"}'
+
 
 @router.get("/healthz")
-async def healthz() -> dict[str, str]:
-    # Liveness: process is up and serving HTTP.
-    return {"status": "ok"}
+async def healthz() -> Response:
+    # Liveness: process is up and serving HTTP. Must not depend on the DB (e.g. `db_session`),
+    # otherwise a DB outage would restart healthy pods.
+    return Response(content=_OK_BODY, media_type="application/json")
 
 
 @router.get("/readyz")
-async def readyz(session: AsyncSession = Depends(db_session)) -> dict[str, str]:
-    # Readiness: verify critical dependency (DB) is reachable.
-    await session.execute(text("SELECT 1"))
-    return {"status": "ready"}
+async def readyz(request: Request) -> Response:
+    # Readiness: verify critical dependency (DB) is reachable. Uses a bare pooled connection
+    # (no ORM session) and skips the ping if one succeeded within the TTL.
+    state = request.app.state
+    if monotonic() - getattr(state, "ready_checked_at", float("-inf")) > _READY_TTL_S:
+        engine: AsyncEngine = state.engine
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        state.ready_checked_at = monotonic()
+    return Response(content=_READY_BODY, media_type="application/json")
 
 
 # --- Module Notes -----------------------------------------------------------
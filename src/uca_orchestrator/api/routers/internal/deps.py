@@ -0,0 +1,22 @@
+"""
+uca_orchestrator.api.routers.internal.deps
+
+Shared dependencies for internal tool routers.
+
+Responsibilities:
+- Provide the single RBAC dependency (role=internal_system) used by every system router.
+"""
+
+from __future__ import annotations
+
+from fastapi import Depends
+
+from uca_orchestrator.auth.deps import require_roles
+
+# One Depends object (and one underlying callable) for all internal routes, so FastAPI's
+# per-request dependency cache treats every occurrence as the same dependency.
+internal_system_dep = Depends(require_roles("internal_system"))
+
+
+# --- Module Notes -----------------------------------------------------------
+# Kept separate from `internal.router` so system modules can import it without a cycle.
@@ -38,3 +38,5 @@ router.include_router(hydra.router, prefix="/hydra")
 
 # --- Module Notes -----------------------------------------------------------
 # These endpoints simulate external/internal governance systems while keeping the repo self-contained.
+# Handlers return instances of their `response_model`; FastAPI passes those through without
+# revalidation and dumps them straight to JSON bytes, so no custom response class is needed.
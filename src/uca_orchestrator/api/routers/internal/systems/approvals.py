@@ -11,6 +11,7 @@ Responsibilities:
 from __future__ import annotations
 
 import uuid
+from collections.abc import Callable
 from typing import Any, Literal
 
 from fastapi import APIRouter, Depends, HTTPException
@@ -19,10 +20,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.status import HTTP_404_NOT_FOUND
 
 from uca_orchestrator.api.deps import db_session
-from uca_orchestrator.auth.deps import require_roles
+from uca_orchestrator.api.routers.internal.deps import internal_system_dep
+from uca_orchestrator.db.models import ArtifactType
 from uca_orchestrator.db.repositories.use_cases import UseCaseRepo
 
-router = APIRouter(dependencies=[Depends(require_roles("internal_system"))])
+router = APIRouter(dependencies=[internal_system_dep])
 
 
 ApprovalState = Literal["PENDING", "APPROVED", "REJECTED"]
@@ -39,6 +41,63 @@ class ApprovalStatusResponse(BaseModel):
     meta: dict[str, Any] = Field(default_factory=dict)
 
 
+# Only the artifacts the rules below test need a bit; others are ignored.
+_ARTIFACT_BITS: dict[str, int] = {
+    ArtifactType.model_governance_answers.value: 1 << 0,
+    ArtifactType.threat_model.value: 1 << 1,
+    ArtifactType.ai_firewall_rules.value: 1 << 2,
+}
+_MISSING_GOVERNANCE = _ARTIFACT_BITS[ArtifactType.model_governance_answers.value]
+_MISSING_THREAT_MODEL = _ARTIFACT_BITS[ArtifactType.threat_model.value]
+_MISSING_FIREWALL_RULES = _ARTIFACT_BITS[ArtifactType.ai_firewall_rules.value]
+
+# Score above which toxicity / prompt-injection metrics count against approval.
+_SCORE_LIMIT = 0.07
+
+# Each rule takes (missing_mask, toxicity, prompt_injection) and returns a rejection
+# comment, or None when the system approves.
+_Rule = Callable[[int, float, float], "str | None"]
+
+_RULES: tuple[tuple[str, _Rule], ...] = (
+    # Model governance (example rule: reject if governance Q&A is missing).
+    (
+        "MODEL_GOVERNANCE",
+        lambda mask, tox, inj: "Missing governance Q&A" if mask & _MISSING_GOVERNANCE else None,
+    ),
+    # NetSec (example rule: reject if threat model is missing).
+    (
+        "NETSECOPS",
+        lambda mask, tox, inj: "Threat model missing" if mask & _MISSING_THREAT_MODEL else None,
+    ),
+    # Risk/compliance: reject if toxicity too high.
+    (
+        "RISK",
+        lambda mask, tox, inj: f"Toxicity too high: {tox:.2f}" if tox > _SCORE_LIMIT else None,
+    ),
+    # AI firewall: require rules if prompt injection too high and rules are missing.
+    (
+        "AI_FIREWALL",
+        lambda mask, tox, inj: (
+            "Firewall rules required"
+            if inj > _SCORE_LIMIT and mask & _MISSING_FIREWALL_RULES
+            else None
+        ),
+    ),
+)
+
+# APPROVED items are identical across requests; build them once without validation.
+_APPROVED: dict[str, ApprovalItem] = {
+    system: ApprovalItem.model_construct(system=system, state="APPROVED", comment=None)
+    for system, _ in _RULES
+}
+# Shared snapshot entry for approved systems; only ever serialized, never mutated.
+_APPROVED_SNAPSHOT: dict[str, str | None] = {"state": "APPROVED", "comment": None}
+_ALL_APPROVED_ITEMS: tuple[ApprovalItem, ...] = tuple(_APPROVED.values())
+_ALL_APPROVED_SNAPSHOT: dict[str, dict[str, str | None]] = {
+    system: _APPROVED_SNAPSHOT for system in _APPROVED
+}
+
+
 @router.get("/{use_case_id}/status", response_model=ApprovalStatusResponse)
 async def get_approval_status(
     use_case_id: uuid.UUID,
@@ -46,55 +105,39 @@ async def get_approval_status(
 ) -> ApprovalStatusResponse:
     # Internal auth is enforced at router creation: role=internal_system.
     repo = UseCaseRepo(session)
-    uc = await repo.get(use_case_id)
-    if uc is None:
+    inputs = await repo.get_approval_inputs(use_case_id)
+    if inputs is None:
         raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="Use case not found")
 
-    missing = set(uc.missing_artifacts or [])
-    metrics = uc.eval_metrics or {}
+    missing_artifacts, eval_metrics = inputs
+    missing_mask = 0
+    for artifact in missing_artifacts or ():
+        missing_mask |= _ARTIFACT_BITS.get(artifact, 0)
+    metrics = eval_metrics or {}
 
     toxicity = float(metrics.get("toxicity", 0.0) or 0.0)
     prompt_inj = float(metrics.get("prompt_injection", 0.0) or 0.0)
 
-    approvals: list[ApprovalItem] = []
-
-    # Model governance (example rule: reject if governance Q&A is missing).
-    if "MODEL_GOVERNANCE_ANSWERS" in missing:
-        approvals.append(
-            ApprovalItem(
-                system="MODEL_GOVERNANCE", state="REJECTED", comment="Missing governance Q&A"
-            )
-        )
-    else:
-        approvals.append(ApprovalItem(system="MODEL_GOVERNANCE", state="APPROVED"))
-
-    # NetSec (example rule: reject if threat model is missing).
-    if "THREAT_MODEL" in missing:
-        approvals.append(
-            ApprovalItem(system="NETSECOPS", state="REJECTED", comment="Threat model missing")
-        )
-    else:
-        approvals.append(ApprovalItem(system="NETSECOPS", state="APPROVED"))
-
-    # Risk/compliance: reject if toxicity too high.
-    if toxicity > 0.07:
-        approvals.append(
-            ApprovalItem(
-                system="RISK", state="REJECTED", comment=f"Toxicity too high: {toxicity:.2f}"
-            )
-        )
-    else:
-        approvals.append(ApprovalItem(system="RISK", state="APPROVED"))
-
-    # AI firewall: require rules if prompt injection too high and rules are missing.
-    if prompt_inj > 0.07 and "AI_FIREWALL_RULES" in missing:
-        approvals.append(
-            ApprovalItem(system="AI_FIREWALL", state="REJECTED", comment="Firewall rules required")
-        )
+    approvals: list[ApprovalItem]
+    snapshot: dict[str, dict[str, str | None]]
+    if not missing_mask and toxicity <= _SCORE_LIMIT:
+        # Common case: with no relevant artifact missing, only toxicity can reject (the
+        # firewall rule also needs a missing artifact), so every system approves.
+        approvals = list(_ALL_APPROVED_ITEMS)
+        snapshot = _ALL_APPROVED_SNAPSHOT
     else:
-        approvals.append(ApprovalItem(system="AI_FIREWALL", state="APPROVED"))
+        # One pass builds both the response items and the persisted snapshot.
+        approvals = []
+        snapshot = {}
+        for system, rule in _RULES:
+            comment = rule(missing_mask, toxicity, prompt_inj)
+            if comment is None:
+                approvals.append(_APPROVED[system])
+                snapshot[system] = _APPROVED_SNAPSHOT
+            else:
+                approvals.append(ApprovalItem(system=system, state="REJECTED", comment=comment))
+                snapshot[system] = {"state": "REJECTED", "comment": comment}
 
-    snapshot = {a.system: {"state": a.state, "comment": a.comment} for a in approvals}
     await repo.patch_governance_snapshot(use_case_id=use_case_id, approval_status=snapshot)
     await session.commit()
 
@@ -103,3 +146,4 @@ async def get_approval_status(
 
 # --- Module Notes -----------------------------------------------------------
 # Approvals are read by the orchestrator during parallel fetch and approval_check.
+# Rules are evaluated in table order, which is also the order of the response list.
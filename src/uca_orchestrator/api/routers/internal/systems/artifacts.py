@@ -17,10 +17,10 @@ from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from uca_orchestrator.api.deps import db_session
-from uca_orchestrator.auth.deps import require_roles
+from uca_orchestrator.api.routers.internal.deps import internal_system_dep
 from uca_orchestrator.db.repositories.artifacts import ArtifactRepo
 
-router = APIRouter(dependencies=[Depends(require_roles("internal_system"))])
+router = APIRouter(dependencies=[internal_system_dep])
 
 
 class ArtifactStatusResponse(BaseModel):
@@ -33,8 +33,8 @@ async def artifact_status(
     session: AsyncSession = Depends(db_session),
 ) -> ArtifactStatusResponse:
     # This endpoint is intentionally lightweight; content retrieval is handled by public APIs.
-    artifacts = await ArtifactRepo(session).list_for_use_case(use_case_id)
-    return ArtifactStatusResponse(artifact_types=[a.type.value for a in artifacts])
+    types = await ArtifactRepo(session).list_types_for_use_case(use_case_id)
+    return ArtifactStatusResponse(artifact_types=types)
 
 
 # --- Module Notes -----------------------------------------------------------
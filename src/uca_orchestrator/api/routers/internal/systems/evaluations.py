@@ -19,10 +19,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.status import HTTP_404_NOT_FOUND
 
 from uca_orchestrator.api.deps import db_session
-from uca_orchestrator.auth.deps import require_roles
+from uca_orchestrator.api.routers.internal.deps import internal_system_dep
 from uca_orchestrator.db.repositories.use_cases import UseCaseRepo
 
-router = APIRouter(dependencies=[Depends(require_roles("internal_system"))])
+router = APIRouter(dependencies=[internal_system_dep])
 
 
 class TriggerEvalRequest(BaseModel):
@@ -40,14 +40,15 @@ async def trigger_evaluations(
     session: AsyncSession = Depends(db_session),
 ) -> EvalStatusResponse:
     repo = UseCaseRepo(session)
-    uc = await repo.get(use_case_id)
-    if uc is None:
+    inputs = await repo.get_eval_inputs(use_case_id)
+    if inputs is None:
         raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="Use case not found")
+    classification, eval_metrics = inputs
 
     # Dummy metrics: predictable and slightly strict for PCI to force remediation/escalation paths.
-    cls = (uc.classification or {}).get("data_classification", "UNKNOWN")
+    cls = classification.get("data_classification", "UNKNOWN") if classification else "UNKNOWN"
     base_toxicity = 0.03 if cls == "NON_PCI" else 0.08 if cls == "PCI" else 0.05
-    metrics = dict(uc.eval_metrics or {})
+    metrics = dict(eval_metrics or {})
     for ev in body.evaluations:
         if ev == "TOXICITY":
             metrics["toxicity"] = base_toxicity
@@ -77,4 +78,4 @@ async def get_eval_status(
 
 
 # --- Module Notes -----------------------------------------------------------
-# The orchestrator triggers evals via InternalApiClient in `eval_check_node`.
+# The orchestrator triggers evals via the governance client in `eval_check_node`.
@@ -17,11 +17,12 @@ from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from uca_orchestrator.api.deps import db_session
-from uca_orchestrator.auth.deps import require_roles
+from uca_orchestrator.api.routers.internal.deps import internal_system_dep
+from uca_orchestrator.cache import TTLCache
 from uca_orchestrator.db.models import ArtifactType
 from uca_orchestrator.db.repositories.artifacts import ArtifactRepo
 
-router = APIRouter(dependencies=[Depends(require_roles("internal_system"))])
+router = APIRouter(dependencies=[internal_system_dep])
 
 
 class FirewallResponse(BaseModel):
@@ -29,17 +30,31 @@ class FirewallResponse(BaseModel):
     notes: str | None = None
 
 
+# The only two answers, built once; handlers hand out these shared (read-only) instances.
+_PASS = FirewallResponse.model_construct(status="PASS", notes="Dummy firewall rules present")
+_PENDING = FirewallResponse.model_construct(status="PENDING", notes="Firewall rules missing")
+
+# Rules only change when the orchestrator persists artifacts, which invalidates this entry.
+_CACHE: TTLCache[uuid.UUID, FirewallResponse] = TTLCache(ttl_s=30.0, maxsize=4096)
+
+
 @router.get("/{use_case_id}/check", response_model=FirewallResponse)
 async def firewall_check(
     use_case_id: uuid.UUID,
     session: AsyncSession = Depends(db_session),
 ) -> FirewallResponse:
+    cached = _CACHE.get(use_case_id)
+    if cached is not None:
+        return cached
+    generation = _CACHE.generation(use_case_id)
+
     # Dummy rule: presence of rules artifact implies pass.
-    artifacts = await ArtifactRepo(session).list_for_use_case(use_case_id)
-    has_rules = any(a.type == ArtifactType.ai_firewall_rules for a in artifacts)
-    if has_rules:
-        return FirewallResponse(status="PASS", notes="Dummy firewall rules present")
-    return FirewallResponse(status="PENDING", notes="Firewall rules missing")
+    has_rules = await ArtifactRepo(session).exists_of_type(
+        use_case_id, ArtifactType.ai_firewall_rules
+    )
+    resp = _PASS if has_rules else _PENDING
+    _CACHE.set(use_case_id, resp, generation=generation)
+    return resp
 
 
 # --- Module Notes -----------------------------------------------------------
@@ -18,10 +18,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.status import HTTP_404_NOT_FOUND
 
 from uca_orchestrator.api.deps import db_session
-from uca_orchestrator.auth.deps import require_roles
+from uca_orchestrator.api.routers.internal.deps import internal_system_dep
+from uca_orchestrator.db.models import UseCaseStatus
 from uca_orchestrator.db.repositories.use_cases import UseCaseRepo
 
-router = APIRouter(dependencies=[Depends(require_roles("internal_system"))])
+router = APIRouter(dependencies=[internal_system_dep])
 
 
 class HydraResponse(BaseModel):
@@ -29,19 +30,22 @@ class HydraResponse(BaseModel):
     notes: str | None = None
 
 
+# Both answers are fixed, so they are built once and shared (read-only).
+_READY = HydraResponse.model_construct(status="READY", notes="Dummy deployment ready")
+_BLOCKED = HydraResponse.model_construct(status="BLOCKED", notes="Approval not complete")
+
+
 @router.get("/{use_case_id}/readiness", response_model=HydraResponse)
 async def hydra_readiness(
     use_case_id: uuid.UUID,
     session: AsyncSession = Depends(db_session),
 ) -> HydraResponse:
-    uc = await UseCaseRepo(session).get(use_case_id)
-    if uc is None:
+    status = await UseCaseRepo(session).get_status(use_case_id)
+    if status is None:
         raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="Use case not found")
 
     # Dummy: blocked until approval-ready.
-    if uc.status.value == "APPROVAL_READY":
-        return HydraResponse(status="READY", notes="Dummy deployment ready")
-    return HydraResponse(status="BLOCKED", notes="Approval not complete")
+    return _READY if status is UseCaseStatus.approval_ready else _BLOCKED
 
 
 # --- Module Notes -----------------------------------------------------------
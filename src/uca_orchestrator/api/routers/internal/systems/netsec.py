@@ -18,10 +18,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.status import HTTP_404_NOT_FOUND
 
 from uca_orchestrator.api.deps import db_session
-from uca_orchestrator.auth.deps import require_roles
+from uca_orchestrator.api.routers.internal.deps import internal_system_dep
+from uca_orchestrator.cache import TTLCache
 from uca_orchestrator.db.repositories.use_cases import UseCaseRepo
 
-router = APIRouter(dependencies=[Depends(require_roles("internal_system"))])
+router = APIRouter(dependencies=[internal_system_dep])
 
 
 class NetSecResponse(BaseModel):
@@ -29,22 +30,38 @@ class NetSecResponse(BaseModel):
     notes: str | None = None
 
 
+# Fixed answers built once, keyed by deployment target; anything else is PENDING.
+_BY_DEPLOYMENT = {
+    "CLOUD": NetSecResponse.model_construct(status="PASS", notes="Dummy cloud baseline satisfied"),
+    "ON_PREM": NetSecResponse.model_construct(
+        status="PASS", notes="Dummy on-prem baseline satisfied"
+    ),
+}
+_PENDING = NetSecResponse.model_construct(status="PENDING", notes="Missing deployment target")
+
+# Derived from the classification snapshot; invalidated when the orchestrator persists it.
+_CACHE: TTLCache[uuid.UUID, NetSecResponse] = TTLCache(ttl_s=30.0, maxsize=4096)
+
+
 @router.get("/{use_case_id}/baseline", response_model=NetSecResponse)
 async def netsec_baseline(
     use_case_id: uuid.UUID,
     session: AsyncSession = Depends(db_session),
 ) -> NetSecResponse:
-    uc = await UseCaseRepo(session).get(use_case_id)
-    if uc is None:
+    cached = _CACHE.get(use_case_id)
+    if cached is not None:
+        return cached
+    generation = _CACHE.generation(use_case_id)
+
+    classification = await UseCaseRepo(session).get_classification(use_case_id)
+    if classification is None:
         raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="Use case not found")
 
     # Simple classification-derived decision; production systems would call scanners / policy engines.
-    deployment = (uc.classification or {}).get("deployment_target", "UNKNOWN")
-    if deployment == "CLOUD":
-        return NetSecResponse(status="PASS", notes="Dummy cloud baseline satisfied")
-    if deployment == "ON_PREM":
-        return NetSecResponse(status="PASS", notes="Dummy on-prem baseline satisfied")
-    return NetSecResponse(status="PENDING", notes="Missing deployment target")
+    deployment = classification.get("deployment_target", "UNKNOWN") if classification else "UNKNOWN"
+    resp = _BY_DEPLOYMENT.get(deployment, _PENDING)
+    _CACHE.set(use_case_id, resp, generation=generation)
+    return resp
 
 
 # --- Module Notes -----------------------------------------------------------
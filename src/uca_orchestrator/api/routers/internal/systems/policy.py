@@ -10,14 +10,15 @@ Responsibilities:
 
 from __future__ import annotations
 
-from typing import Any, Literal
+from itertools import product
+from typing import Any, Literal, get_args
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter
 from pydantic import BaseModel, Field
 
-from uca_orchestrator.auth.deps import require_roles
+from uca_orchestrator.api.routers.internal.deps import internal_system_dep
 
-router = APIRouter(dependencies=[Depends(require_roles("internal_system"))])
+router = APIRouter(dependencies=[internal_system_dep])
 
 
 class PolicyRequest(BaseModel):
@@ -32,36 +33,53 @@ class PolicyResponse(BaseModel):
     meta: dict[str, Any] = Field(default_factory=dict)
 
 
-@router.post("/requirements", response_model=PolicyResponse)
-async def get_policy_requirements(body: PolicyRequest) -> PolicyResponse:
+def _evaluate(
+    data_classification: str, deployment_target: str, model_provider: str
+) -> PolicyResponse:
     # In production this logic would likely be data-driven (policy tables/rules engine).
     required_artifacts: list[str] = []
     required_evaluations: list[str] = []
 
-    if body.data_classification == "PCI":
+    if data_classification == "PCI":
         required_artifacts += ["REDACTION_PLAN", "THREAT_MODEL"]
         required_evaluations += ["REDACTABILITY", "TOXICITY", "PROMPT_INJECTION"]
     else:
         required_artifacts += ["MODEL_GOVERNANCE_ANSWERS"]
         required_evaluations += ["TOXICITY"]
 
-    if body.deployment_target == "CLOUD":
+    if deployment_target == "CLOUD":
         required_artifacts += ["AI_FIREWALL_RULES"]
         required_evaluations += ["NETSEC_BASELINE"]
 
-    if body.model_provider == "EXTERNAL":
+    if model_provider == "EXTERNAL":
         required_artifacts += ["AI_FIREWALL_RULES"]
 
     # de-dupe while keeping order
     required_artifacts = list(dict.fromkeys(required_artifacts))
     required_evaluations = list(dict.fromkeys(required_evaluations))
 
-    return PolicyResponse(
+    # Built from literals above; no need to validate.
+    return PolicyResponse.model_construct(
         required_artifacts=required_artifacts,
         required_evaluations=required_evaluations,
         meta={"policy_version": "dummy-2026-02-12"},
     )
 
 
+# The input space is 3x3x3 Literal values, so every answer is evaluated once at import.
+# Responses are shared: callers must treat them as read-only.
+_FIELDS = ("data_classification", "deployment_target", "model_provider")
+POLICY_RULES: dict[tuple[str, str, str], PolicyResponse] = {
+    combo: _evaluate(*combo)
+    for combo in product(*(get_args(PolicyRequest.model_fields[f].annotation) for f in _FIELDS))
+}
+
+
+@router.post("/requirements", response_model=PolicyResponse)
+async def get_policy_requirements(body: PolicyRequest) -> PolicyResponse:
+    return POLICY_RULES[(body.data_classification, body.deployment_target, body.model_provider)]
+
+
 # --- Module Notes -----------------------------------------------------------
 # Policy requirements are consumed by the orchestrator during parallel fetch/gap analysis.
+# Policy drift means changing `_evaluate` (or the version in `meta`); the table follows.
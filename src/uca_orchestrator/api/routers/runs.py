@@ -12,18 +12,17 @@ from __future__ import annotations
 import uuid
 from typing import Any
 
-import httpx
 from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.status import HTTP_404_NOT_FOUND
 
-from uca_orchestrator.api.deps import db_session, settings_dep
+from uca_orchestrator.api.deps import db_session
 from uca_orchestrator.auth.deps import get_principal, require_roles
 from uca_orchestrator.auth.models import Principal
 from uca_orchestrator.db.repositories.runs import RunRepo
 from uca_orchestrator.services.orchestration_service import OrchestrationService
-from uca_orchestrator.settings import Settings
+from uca_orchestrator.settings import Settings, settings_dep
 
 router = APIRouter(prefix="/v1/runs", tags=["runs"])
 
@@ -49,13 +48,10 @@ async def resume_run(
     if run is None:
         raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="Run not found")
 
-    # Use ASGITransport for in-process tool calls during resume execution.
-    transport = httpx.ASGITransport(app=request.app)
-    async with httpx.AsyncClient(
-        transport=transport, base_url=str(request.base_url).rstrip("/")
-    ) as http:
-        svc = OrchestrationService(session=session, settings=settings, http=http)
-        return await svc.resume(run_id=run_id, actor=principal.subject, decision=body.decision)
+    # In-process tool calls during resume execution.
+    client = request.app.state.governance_client
+    svc = OrchestrationService(session=session, settings=settings, client=client)
+    return await svc.resume(run_id=run_id, actor=principal.subject, decision=body.decision)
 
 
 # --- Module Notes -----------------------------------------------------------
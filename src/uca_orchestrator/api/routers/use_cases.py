@@ -12,23 +12,23 @@ Responsibilities:
 from __future__ import annotations
 
 import uuid
+from datetime import datetime
 from typing import Any
 
-import httpx
 from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.status import HTTP_404_NOT_FOUND
 
-from uca_orchestrator.api.deps import db_session, settings_dep
+from uca_orchestrator.api.deps import db_session
+from uca_orchestrator.api.responses import ORJSONResponse
 from uca_orchestrator.auth.deps import get_principal, require_roles
 from uca_orchestrator.auth.models import Principal
-from uca_orchestrator.db.repositories.artifacts import ArtifactRepo
 from uca_orchestrator.db.repositories.audit import AuditRepo
 from uca_orchestrator.db.repositories.runs import RunRepo
 from uca_orchestrator.db.repositories.use_cases import UseCaseRepo
 from uca_orchestrator.services.orchestration_service import OrchestrationService
-from uca_orchestrator.settings import Settings
+from uca_orchestrator.settings import Settings, settings_dep
 
 router = APIRouter(prefix="/v1/use-cases", tags=["use-cases"])
 
@@ -43,6 +43,15 @@ class UseCaseRegisterResponse(BaseModel):
     run_id: uuid.UUID
 
 
+class AuditEventResponse(BaseModel):
+    # `id` is the database-assigned sequence number (an integer, not a UUID).
+    id: int
+    event_type: str
+    actor: str
+    details: dict[str, Any]
+    created_at: datetime
+
+
 class UseCaseResponse(BaseModel):
     id: uuid.UUID
     owner: str
@@ -75,22 +84,18 @@ async def register_use_case(
     )
 
     # Create initial run (execution is explicit via /orchestrate).
-    # We use ASGITransport so "tool calls" can hit internal endpoints in-process (no real network).
-    transport = httpx.ASGITransport(app=request.app)
-    async with httpx.AsyncClient(
-        transport=transport, base_url=str(request.base_url).rstrip("/")
-    ) as http:
-        svc = OrchestrationService(session=session, settings=settings, http=http)
-        run_id = await svc.start(use_case_id=uc.id, actor=principal.subject)
-        await AuditRepo(session).add(
-            use_case_id=uc.id,
-            run_id=run_id,
-            actor=principal.subject,
-            event_type="USE_CASE_REGISTERED",
-            details={"external_use_case_id": body.external_use_case_id},
-        )
-        await session.commit()
-        return UseCaseRegisterResponse(use_case_id=uc.id, run_id=run_id)
+    client = request.app.state.governance_client
+    svc = OrchestrationService(session=session, settings=settings, client=client)
+    run_id = await svc.start(use_case_id=uc.id, actor=principal.subject)
+    await AuditRepo(session).add(
+        use_case_id=uc.id,
+        run_id=run_id,
+        actor=principal.subject,
+        event_type="USE_CASE_REGISTERED",
+        details={"external_use_case_id": body.external_use_case_id},
+    )
+    await session.commit()
+    return UseCaseRegisterResponse(use_case_id=uc.id, run_id=run_id)
 
 
 @router.get(
@@ -108,7 +113,8 @@ async def get_use_case(
         raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="Use case not found")
     if uc.owner != principal.subject and not principal.is_admin:
         raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="Use case not found")
-    return UseCaseResponse(
+    # Values come straight from typed ORM columns, so construction skips validation.
+    return UseCaseResponse.model_construct(
         id=uc.id,
         owner=uc.owner,
         status=uc.status.value,
@@ -131,76 +137,86 @@ async def orchestrate_use_case(
     session: AsyncSession = Depends(db_session),
     settings: Settings = Depends(settings_dep),
 ) -> dict[str, Any]:
-    uc = await UseCaseRepo(session).get(use_case_id)
-    if uc is None:
+    # Only the owner is needed here; the service loads the full row when it executes.
+    owner = await UseCaseRepo(session).get_owner(use_case_id)
+    if owner is None:
         raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="Use case not found")
-    if uc.owner != principal.subject and not principal.is_admin:
+    if owner != principal.subject and not principal.is_admin:
         raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="Use case not found")
 
-    # Use ASGITransport to make real HTTP calls to internal endpoints (JWT-protected) without network.
-    transport = httpx.ASGITransport(app=request.app)
-    async with httpx.AsyncClient(
-        transport=transport, base_url=str(request.base_url).rstrip("/")
-    ) as http:
-        svc = OrchestrationService(session=session, settings=settings, http=http)
-        latest = await RunRepo(session).latest_for_use_case(use_case_id)
-        run_id = (
-            latest.id
-            if latest is not None
-            else await svc.start(use_case_id=use_case_id, actor=principal.subject)
-        )
-        return await svc.execute(run_id=run_id, actor=principal.subject)
+    # Tool calls go straight to the internal system handlers (no HTTP/ASGI round-trip).
+    client = request.app.state.governance_client
+    svc = OrchestrationService(session=session, settings=settings, client=client)
+    latest = await RunRepo(session).latest_for_use_case(use_case_id)
+    run_id = (
+        latest.id
+        if latest is not None
+        else await svc.start(use_case_id=use_case_id, actor=principal.subject)
+    )
+    return await svc.execute(run_id=run_id, actor=principal.subject)
 
 
 @router.get(
     "/{use_case_id}/audit",
+    response_model=list[AuditEventResponse],
     dependencies=[Depends(require_roles("use_case_owner"))],
 )
 async def list_audit_events(
     use_case_id: uuid.UUID,
     principal: Principal = Depends(get_principal),
     session: AsyncSession = Depends(db_session),
-) -> list[dict[str, Any]]:
+) -> ORJSONResponse:
     # Audit is returned newest-first (see AuditRepo); clients can reverse if desired.
-    uc = await UseCaseRepo(session).get(use_case_id)
-    if uc is None or (uc.owner != principal.subject and not principal.is_admin):
+    found = await UseCaseRepo(session).get_with_audit(use_case_id)
+    if found is None:
+        raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="Use case not found")
+    owner, events = found
+    if owner != principal.subject and not principal.is_admin:
         raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="Use case not found")
-    events = await AuditRepo(session).list_for_use_case(use_case_id)
-    return [
-        {
-            "id": str(e.id),
-            "event_type": e.event_type,
-            "actor": e.actor,
-            "details": e.details,
-            "created_at": e.created_at.isoformat(),
-        }
-        for e in events
-    ]
+    # Returned as a Response so FastAPI skips validating/encoding the list (`response_model`
+    # only documents the shape); orjson renders the UUIDs and datetimes natively.
+    return ORJSONResponse(
+        [
+            {
+                "id": e.id,
+                "event_type": e.event_type,
+                "actor": e.actor,
+                "details": e.details,
+                "created_at": e.created_at,
+            }
+            for e in events
+        ]
+    )
 
 
 @router.get(
     "/{use_case_id}/artifacts",
+    response_model=list[dict[str, Any]],
     dependencies=[Depends(require_roles("use_case_owner"))],
 )
 async def list_artifacts(
     use_case_id: uuid.UUID,
     principal: Principal = Depends(get_principal),
     session: AsyncSession = Depends(db_session),
-) -> list[dict[str, Any]]:
-    uc = await UseCaseRepo(session).get(use_case_id)
-    if uc is None or (uc.owner != principal.subject and not principal.is_admin):
+) -> ORJSONResponse:
+    found = await UseCaseRepo(session).get_with_artifacts(use_case_id)
+    if found is None:
+        raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="Use case not found")
+    owner, artifacts = found
+    if owner != principal.subject and not principal.is_admin:
         raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="Use case not found")
-    artifacts = await ArtifactRepo(session).list_for_use_case(use_case_id)
-    return [
-        {
-            "id": str(a.id),
-            "type": a.type.value,
-            "content_type": a.content_type,
-            "content": a.content,
-            "created_at": a.created_at.isoformat(),
-        }
-        for a in artifacts
-    ]
+    return ORJSONResponse(
+        [
+            {
+                "id": a.id,
+                "type": a.type.value,
+                "content_type": a.content_type,
+                "content": a.content,
+                "created_at": a.created_at,
+            }
+            for a in artifacts
+        ]
+    )
 
 
 # --- Module Notes -----------------------------------------------------------
@@ -6,21 +6,32 @@ FastAPI dependency functions for authentication and authorization.
 Responsibilities:
 - Convert a bearer token into a typed `Principal`.
 - Enforce RBAC via reusable dependency factories.
+- Cache validated principals per token until the token expires.
 """
 
 from __future__ import annotations
 
+import hashlib
+import time
+from functools import cache, lru_cache
+
 from fastapi import Depends, HTTPException
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from starlette.status import HTTP_401_UNAUTHORIZED, HTTP_403_FORBIDDEN
 
 from uca_orchestrator.auth.jwt import JwtConfig, JwtValidationError, decode_and_validate
 from uca_orchestrator.auth.models import Principal
-from uca_orchestrator.settings import Settings, get_settings
+from uca_orchestrator.settings import Settings, settings_dep
 
 _bearer = HTTPBearer(auto_error=False)
 
+# Validated principals keyed by (config, token digest) -> (exp, principal). Only successful
+# validations are stored; an entry is used strictly before the token's `exp`.
+_PRINCIPALS: dict[tuple[JwtConfig, bytes], tuple[float, Principal]] = {}
+_PRINCIPALS_MAX = 4096
+
 
+@lru_cache(maxsize=8)
 def _jwt_cfg(settings: Settings) -> JwtConfig:
     return JwtConfig(
         alg=settings.jwt_alg,
@@ -30,17 +41,25 @@ def _jwt_cfg(settings: Settings) -> JwtConfig:
     )
 
 
-def get_principal(
+async def get_principal(
     creds: HTTPAuthorizationCredentials | None = Depends(_bearer),
-    settings: Settings = Depends(get_settings),
+    settings: Settings = Depends(settings_dep),
 ) -> Principal:
+    # async so FastAPI runs it on the event loop, not the threadpool: the `_PRINCIPALS`
+    # check/evict/insert below has no await in between, so it cannot interleave.
     # Authn: require a bearer token.
     if creds is None or not creds.credentials:
         raise HTTPException(status_code=HTTP_401_UNAUTHORIZED, detail="Missing bearer token")
 
+    cfg = _jwt_cfg(settings)
+    key = (cfg, hashlib.blake2b(creds.credentials.encode(), digest_size=16).digest())
+    hit = _PRINCIPALS.get(key)
+    if hit is not None and time.time() < hit[0]:
+        return hit[1]
+
     try:
         # Authn: validate signature and registered claims (iss/aud/exp/sub...).
-        payload = decode_and_validate(cfg=_jwt_cfg(settings), token=creds.credentials)
+        payload = decode_and_validate(cfg=cfg, token=creds.credentials)
     except JwtValidationError as e:
         raise HTTPException(status_code=HTTP_401_UNAUTHORIZED, detail=f"Invalid token: {e}") from e
 
@@ -52,11 +71,32 @@ def get_principal(
     if not isinstance(roles_raw, list):
         raise HTTPException(status_code=HTTP_401_UNAUTHORIZED, detail="Invalid token roles")
 
-    roles: frozenset[str] = frozenset(str(r) for r in roles_raw)
-    return Principal(subject=subject, roles=roles)
+    # map(str, ...) stays in C (no generator frame); str() of a str returns it unchanged.
+    roles: frozenset[str] = frozenset(map(str, roles_raw))
+    principal = Principal(subject=subject, roles=roles)
+    if len(_PRINCIPALS) >= _PRINCIPALS_MAX:
+        # Insertion order approximates age; drop the oldest entry.
+        _PRINCIPALS.pop(next(iter(_PRINCIPALS)), None)
+    _PRINCIPALS[key] = (float(payload["exp"]), principal)
+    return principal
 
 
+# Cached so each role set maps to one dependency callable across all routers; FastAPI then
+# resolves it once per request even when several routes/routers declare it.
+@cache
 def require_roles(*required: str):
+    if len(required) == 1:
+        # Every route here needs exactly one role: a membership test, no subset check.
+        role = required[0]
+
+        def _dep_one(principal: Principal = Depends(get_principal)) -> Principal:
+            # Authz: admin is allowed to bypass role checks (ops/debug).
+            if principal.is_admin or role in principal.roles:
+                return principal
+            raise HTTPException(status_code=HTTP_403_FORBIDDEN, detail="Insufficient role")
+
+        return _dep_one
+
     required_set = frozenset(required)
 
     def _dep(principal: Principal = Depends(get_principal)) -> Principal:
@@ -0,0 +1,86 @@
+"""
+uca_orchestrator.cache
+
+Small in-process TTL caches for read-mostly governance responses.
+
+Responsibilities:
+- Hold per-key values for a bounded time (TTL) and size (oldest entry evicted first).
+- Let writers drop every cached entry for a use case after they commit, without a fill
+  that was already in flight storing its (stale) result afterwards.
+
+Caches are process-local: `invalidate_use_case` only reaches this process, so with several
+workers another worker's write is picked up once the entry's TTL expires.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Generic, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+# Every TTLCache registers here so `invalidate_use_case` can reach all of them without the
+# writer importing the modules that own the caches.
+_CACHES: list[TTLCache[Any, Any]] = []
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Not shared across processes: with several workers, the TTL bounds how stale a value
+    can get after another worker's write.
+
+    Fill pattern: take `generation(key)` before reading the source and pass it to `set`;
+    the store is skipped if the key was invalidated in between.
+    """
+
+    def __init__(self, *, ttl_s: float, maxsize: int) -> None:
+        self._ttl_s = ttl_s
+        self._maxsize = maxsize
+        self._data: dict[K, tuple[float, V]] = {}
+        # Per-key invalidation counters. When the table is full it is cleared and the epoch
+        # bumped instead, which makes every in-flight fill skip its store (a miss, not stale).
+        self._generations: dict[K, int] = {}
+        self._epoch = 0
+        _CACHES.append(self)
+
+    def get(self, key: K) -> V | None:
+        hit = self._data.get(key)
+        if hit is None:
+            return None
+        expires_at, value = hit
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    def generation(self, key: K) -> tuple[int, int]:
+        return self._epoch, self._generations.get(key, 0)
+
+    def set(self, key: K, value: V, *, generation: tuple[int, int] | None = None) -> None:
+        if generation is not None and generation != self.generation(key):
+            # Invalidated while the value was being computed: it may predate the write.
+            return
+        if key not in self._data and len(self._data) >= self._maxsize:
+            # Dicts keep insertion order, so the first key is the oldest entry.
+            del self._data[next(iter(self._data))]
+        self._data[key] = (time.monotonic() + self._ttl_s, value)
+
+    def invalidate(self, key: K) -> None:
+        self._data.pop(key, None)
+        if key not in self._generations and len(self._generations) >= self._maxsize:
+            self._generations.clear()
+            self._epoch += 1
+        self._generations[key] = self._generations.get(key, 0) + 1
+
+
+def invalidate_use_case(use_case_id: object) -> None:
+    # Call after committing artifact/classification writes for the use case. Process-local:
+    # other workers keep their entries until the TTL expires.
+    for cache in _CACHES:
+        cache.invalidate(use_case_id)
+
+
+# --- Module Notes -----------------------------------------------------------
+# Deliberately tiny (no async-lru dependency): handlers check/fill the cache explicitly, so
+# error paths (e.g. 404) are never cached.
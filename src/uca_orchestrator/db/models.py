@@ -14,14 +14,35 @@ Responsibilities:
 from __future__ import annotations
 
 import enum
+import os
+import time
 import uuid
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import JSON, Enum, ForeignKey, Index, String, Text, Uuid as SAUuid
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Enum,
+    ForeignKey,
+    Identity,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    Uuid as SAUuid,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from uca_orchestrator.db.base import Base
+from uca_orchestrator.db.types import CompressedMsgpack
+
+# Queryable JSON documents: binary JSONB on Postgres (parsed once at write, sub-key access
+# without reparsing, GIN-indexable); plain JSON elsewhere (SQLite).
+_JSON_DOC = JSON().with_variant(JSONB(), "postgresql")
 
 
 def _utcnow() -> datetime:
@@ -29,6 +50,16 @@ def _utcnow() -> datetime:
     return datetime.utcnow()
 
 
+def _uuid7() -> uuid.UUID:
+    # Time-ordered UUIDv7 (RFC 9562): 48-bit Unix ms timestamp, then random bits. New keys
+    # land at the right edge of the PK B-tree instead of a random leaf (uuid4).
+    ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    rand_a = rand >> 68  # 12 bits
+    rand_b = rand & ((1 << 62) - 1)  # 62 bits
+    return uuid.UUID(int=(ms << 80) | (0x7 << 76) | (rand_a << 64) | (0b10 << 62) | rand_b)
+
+
 class UseCaseStatus(enum.StrEnum):
     # High-level business status of a use case as observed by the orchestration service.
     registered = "REGISTERED"
@@ -56,98 +87,150 @@ class ArtifactType(enum.StrEnum):
     approval_summary = "APPROVAL_SUMMARY"
 
 
+def _str_enum(enum_cls: type[enum.StrEnum], name: str) -> Enum:
+    # Plain VARCHAR + CHECK constraint instead of a native PG ENUM type: adding a member needs
+    # no ALTER TYPE lock, and indexes/filters compare text. Stores the enum *values*
+    # ("APPROVAL_READY"); Python code still reads and writes enum members. Databases created
+    # with native ENUM types / member names must be recreated (see README).
+    return Enum(
+        enum_cls,
+        native_enum=False,
+        create_constraint=True,
+        length=32,
+        name=name,
+        values_callable=lambda cls: [m.value for m in cls],
+    )
+
+
 class UseCase(Base):
     __tablename__ = "use_cases"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        SAUuid(as_uuid=True), primary_key=True, default=uuid.uuid4
-    )
-    external_use_case_id: Mapped[str | None] = mapped_column(String(128), nullable=True, index=True)
+    id: Mapped[uuid.UUID] = mapped_column(SAUuid(as_uuid=True), primary_key=True, default=_uuid7)
+    external_use_case_id: Mapped[str | None] = mapped_column(String(128), nullable=True)
 
     owner: Mapped[str] = mapped_column(String(256), nullable=False)
 
-    submission_payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
-    classification: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
-    approval_status: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
-    eval_metrics: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
+    submission_payload: Mapped[dict[str, Any]] = mapped_column(_JSON_DOC, nullable=False)
+    classification: Mapped[dict[str, Any]] = mapped_column(_JSON_DOC, nullable=False, default=dict)
+    approval_status: Mapped[dict[str, Any]] = mapped_column(_JSON_DOC, nullable=False, default=dict)
+    eval_metrics: Mapped[dict[str, Any]] = mapped_column(_JSON_DOC, nullable=False, default=dict)
 
     risk_level: Mapped[str] = mapped_column(String(32), nullable=False, default="UNKNOWN")
-    missing_artifacts: Mapped[list[str]] = mapped_column(JSON, nullable=False, default=list)
+    missing_artifacts: Mapped[list[str]] = mapped_column(_JSON_DOC, nullable=False, default=list)
 
-    status: Mapped[UseCaseStatus] = mapped_column(Enum(UseCaseStatus), nullable=False, index=True)
+    status: Mapped[UseCaseStatus] = mapped_column(
+        _str_enum(UseCaseStatus, "ck_use_cases_status"), nullable=False
+    )
 
     created_at: Mapped[datetime] = mapped_column(nullable=False, default=_utcnow)
     updated_at: Mapped[datetime] = mapped_column(nullable=False, default=_utcnow, onupdate=_utcnow)
 
-    runs: Mapped[list[Run]] = relationship(back_populates="use_case", cascade="all, delete-orphan")
+    # Relationships never lazy-load: async sessions cannot emit implicit IO, and an accidental
+    # per-parent load is an N+1. Load explicitly (selectinload / repo queries) instead.
+    runs: Mapped[list[Run]] = relationship(
+        back_populates="use_case", cascade="all, delete-orphan", lazy="raise_on_sql"
+    )
     artifacts: Mapped[list[Artifact]] = relationship(
-        back_populates="use_case", cascade="all, delete-orphan"
+        back_populates="use_case", cascade="all, delete-orphan", lazy="raise_on_sql"
+    )
+
+    # For planned status listings ("interrupted/failed, by time"; no query reads them yet). Its
+    # leading column also covers plain status filters, so status has no index of its own.
+    __table_args__ = (
+        Index("ix_use_cases_status_updated", "status", "updated_at"),
+        # Most use cases are never linked upstream: a partial index skips the NULL rows and
+        # still serves `external_use_case_id = :x` lookups.
+        Index(
+            "ix_use_cases_ext_id_notnull",
+            "external_use_case_id",
+            postgresql_where=text("external_use_case_id IS NOT NULL"),
+            sqlite_where=text("external_use_case_id IS NOT NULL"),
+        ),
     )
 
 
 class Run(Base):
     __tablename__ = "runs"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        SAUuid(as_uuid=True), primary_key=True, default=uuid.uuid4
-    )
+    id: Mapped[uuid.UUID] = mapped_column(SAUuid(as_uuid=True), primary_key=True, default=_uuid7)
+    # Indexed by the leading column of ix_runs_use_case_created.
     use_case_id: Mapped[uuid.UUID] = mapped_column(
-        SAUuid(as_uuid=True), ForeignKey("use_cases.id"), nullable=False, index=True
+        SAUuid(as_uuid=True), ForeignKey("use_cases.id"), nullable=False
     )
 
-    status: Mapped[RunStatus] = mapped_column(Enum(RunStatus), nullable=False, index=True)
+    status: Mapped[RunStatus] = mapped_column(
+        _str_enum(RunStatus, "ck_runs_status"), nullable=False
+    )
     # `state` stores the LangGraph state snapshot (checkpointed per node execution).
-    state: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
+    # Checkpoint blob: rewritten after every node and only ever read whole, so it is stored
+    # as compressed msgpack rather than JSON text/JSONB. Rows written as JSON do not decode:
+    # databases created before this format must be recreated (see README).
+    state: Mapped[dict[str, Any]] = mapped_column(CompressedMsgpack(), nullable=False, default=dict)
     remediation_attempts: Mapped[int] = mapped_column(nullable=False, default=0)
 
     interrupted_reason: Mapped[str | None] = mapped_column(Text, nullable=True)
-    interrupted_payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
+    interrupted_payload: Mapped[dict[str, Any]] = mapped_column(
+        _JSON_DOC, nullable=False, default=dict
+    )
 
     error: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(nullable=False, default=_utcnow)
     updated_at: Mapped[datetime] = mapped_column(nullable=False, default=_utcnow, onupdate=_utcnow)
 
-    use_case: Mapped[UseCase] = relationship(back_populates="runs")
+    use_case: Mapped[UseCase] = relationship(back_populates="runs", lazy="raise_on_sql")
 
-    __table_args__ = (Index("ix_runs_use_case_created", "use_case_id", "created_at"),)
+    __table_args__ = (
+        Index("ix_runs_use_case_created", "use_case_id", "created_at"),
+        # Same as use_cases: for planned status listings, in place of a status-only index.
+        Index("ix_runs_status_created", "status", "created_at"),
+    )
 
 
 class Artifact(Base):
     __tablename__ = "artifacts"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        SAUuid(as_uuid=True), primary_key=True, default=uuid.uuid4
-    )
+    id: Mapped[uuid.UUID] = mapped_column(SAUuid(as_uuid=True), primary_key=True, default=_uuid7)
+    # Indexed by the leading column of uq_artifact_usecase_type.
     use_case_id: Mapped[uuid.UUID] = mapped_column(
-        SAUuid(as_uuid=True), ForeignKey("use_cases.id"), nullable=False, index=True
+        SAUuid(as_uuid=True), ForeignKey("use_cases.id"), nullable=False
     )
 
-    type: Mapped[ArtifactType] = mapped_column(Enum(ArtifactType), nullable=False, index=True)
+    type: Mapped[ArtifactType] = mapped_column(
+        _str_enum(ArtifactType, "ck_artifacts_type"), nullable=False, index=True
+    )
     content: Mapped[str] = mapped_column(Text, nullable=False)
     content_type: Mapped[str] = mapped_column(String(64), nullable=False, default="text/markdown")
 
     created_at: Mapped[datetime] = mapped_column(nullable=False, default=_utcnow)
 
-    use_case: Mapped[UseCase] = relationship(back_populates="artifacts")
+    use_case: Mapped[UseCase] = relationship(back_populates="artifacts", lazy="raise_on_sql")
 
-    __table_args__ = (Index("ix_artifacts_use_case_type", "use_case_id", "type"),)
+    # One artifact per type per use case; the constraint's index also serves (use_case_id, type)
+    # lookups and is the conflict target for ArtifactRepo.upsert.
+    __table_args__ = (UniqueConstraint("use_case_id", "type", name="uq_artifact_usecase_type"),)
 
 
 class AuditEvent(Base):
     __tablename__ = "audit_events"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        SAUuid(as_uuid=True), primary_key=True, default=uuid.uuid4
+    # Append-only and never referenced before insert, so the DB assigns the key (identity on
+    # Postgres, rowid alias on SQLite); bulk inserts get ids back via RETURNING. Formerly a UUID
+    # column: older databases must be recreated, and the audit API's `id` is now an integer.
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        Identity(always=True),
+        primary_key=True,
     )
-    use_case_id: Mapped[uuid.UUID] = mapped_column(SAUuid(as_uuid=True), nullable=False, index=True)
+    # Indexed by the leading column of ix_audit_use_case_created.
+    use_case_id: Mapped[uuid.UUID] = mapped_column(SAUuid(as_uuid=True), nullable=False)
     run_id: Mapped[uuid.UUID | None] = mapped_column(
         SAUuid(as_uuid=True), nullable=True, index=True
     )
 
     actor: Mapped[str] = mapped_column(String(256), nullable=False)  # user id / agent / system
     event_type: Mapped[str] = mapped_column(String(128), nullable=False, index=True)
-    details: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
+    details: Mapped[dict[str, Any]] = mapped_column(_JSON_DOC, nullable=False, default=dict)
 
     created_at: Mapped[datetime] = mapped_column(nullable=False, default=_utcnow, index=True)
 
@@ -5,18 +5,28 @@ Repository for `Artifact` entities.
 
 Responsibilities:
 - Upsert generated artifacts by (use_case_id, type).
-- List artifacts for packaging/inspection.
+- List artifacts (or just their types) for packaging/inspection.
+- Check for a single artifact type without loading rows.
 """
 
 from __future__ import annotations
 
 import uuid
+from collections.abc import Callable, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import exists, lambda_stmt, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from uca_orchestrator.db.models import Artifact, ArtifactType
 
+# Dialect-specific INSERT constructs that support ON CONFLICT (the backends this app targets).
+_UpsertInsert = postgresql.Insert | sqlite.Insert
+_INSERTS: dict[str, Callable[[type[Artifact]], _UpsertInsert]] = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
 
 class ArtifactRepo:
     def __init__(self, session: AsyncSession) -> None:
@@ -31,25 +41,46 @@ class ArtifactRepo:
         content_type: str = "text/markdown",
     ) -> Artifact:
         # Upsert semantics: one artifact per type per use case (latest content wins).
-        stmt = select(Artifact).where(Artifact.use_case_id == use_case_id, Artifact.type == type)
-        existing = (await self._session.execute(stmt)).scalar_one_or_none()
-        if existing is not None:
-            existing.content = content
-            existing.content_type = content_type
-            await self._session.flush()
-            return existing
-
-        art = Artifact(
+        # A single INSERT ... ON CONFLICT DO UPDATE on uq_artifact_usecase_type replaces the
+        # SELECT + UPDATE/INSERT round-trips; id/created_at of an existing row are kept.
+        dialect = self._session.get_bind().dialect.name
+        insert = _INSERTS.get(dialect)
+        if insert is None:
+            raise RuntimeError(
+                f"ArtifactRepo.upsert needs ON CONFLICT support; unsupported dialect {dialect!r}"
+                f" (supported: {', '.join(sorted(_INSERTS))})"
+            )
+        stmt = insert(Artifact).values(
             use_case_id=use_case_id, type=type, content=content, content_type=content_type
         )
-        self._session.add(art)
-        await self._session.flush()
-        return art
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Artifact.use_case_id, Artifact.type],
+            set_={"content": stmt.excluded.content, "content_type": stmt.excluded.content_type},
+        )
+        result = await self._session.scalars(
+            stmt.returning(Artifact), execution_options={"populate_existing": True}
+        )
+        return result.one()
 
     async def list_for_use_case(self, use_case_id: uuid.UUID) -> list[Artifact]:
-        stmt = select(Artifact).where(Artifact.use_case_id == use_case_id)
+        stmt = lambda_stmt(lambda: select(Artifact).where(Artifact.use_case_id == use_case_id))
         return list((await self._session.execute(stmt)).scalars().all())
 
+    async def list_types_for_use_case(self, use_case_id: uuid.UUID) -> list[str]:
+        # Narrow read: only the type column, no ORM instances or identity-map entries.
+        stmt = lambda_stmt(lambda: select(Artifact.type).where(Artifact.use_case_id == use_case_id))
+        types: Sequence[ArtifactType] = (await self._session.execute(stmt)).scalars().all()
+        return [t.value for t in types]
+
+    async def exists_of_type(self, use_case_id: uuid.UUID, type: ArtifactType) -> bool:
+        # EXISTS answers from the (use_case_id, type) index without transferring any rows.
+        stmt = lambda_stmt(
+            lambda: select(
+                exists().where(Artifact.use_case_id == use_case_id, Artifact.type == type)
+            )
+        )
+        return bool(await self._session.scalar(stmt))
+
 
 # --- Module Notes -----------------------------------------------------------
 # Artifacts are generated by the orchestrator and persisted by the service layer.
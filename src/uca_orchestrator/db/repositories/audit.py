@@ -4,7 +4,7 @@ uca_orchestrator.db.repositories.audit
 Repository for `AuditEvent` entities.
 
 Responsibilities:
-- Append audit events (agent/system/user actions).
+- Append audit events (agent/system/user actions), singly or in batches.
 - Query audit trail by use case for transparency and compliance.
 """
 
@@ -13,11 +13,14 @@ from __future__ import annotations
 import uuid
 from typing import Any
 
-from sqlalchemy import desc, select
+from sqlalchemy import desc, insert, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from uca_orchestrator.db.models import AuditEvent
 
+# Rows per multi-row INSERT statement when batching (also SQLAlchemy's default).
+_INSERT_PAGE_SIZE = 1000
+
 
 class AuditRepo:
     def __init__(self, session: AsyncSession) -> None:
@@ -44,15 +47,31 @@ class AuditRepo:
         await self._session.flush()
         return ev
 
+    async def add_many(self, rows: list[dict[str, Any]]) -> list[int]:
+        # Batch append: each row carries the `add` keyword fields; ids are DB-assigned and
+        # created_at defaults apply per row. With RETURNING, SQLAlchemy's "insertmanyvalues" emits one
+        # multi-row INSERT ... VALUES (...), (...) RETURNING per page (asyncpg and SQLite alike)
+        # rather than a per-row executemany.
+        if not rows:
+            return []
+        stmt = (
+            insert(AuditEvent)
+            .returning(AuditEvent.id)
+            .execution_options(insertmanyvalues_page_size=_INSERT_PAGE_SIZE)
+        )
+        return list((await self._session.scalars(stmt, rows)).all())
+
     async def list_for_use_case(
         self, use_case_id: uuid.UUID, *, limit: int = 200
     ) -> list[AuditEvent]:
         # Order newest-first for UI consumption; reverse client-side if needed.
-        stmt = (
-            select(AuditEvent)
-            .where(AuditEvent.use_case_id == use_case_id)
-            .order_by(desc(AuditEvent.created_at))
-            .limit(limit)
+        stmt = lambda_stmt(
+            lambda: (
+                select(AuditEvent)
+                .where(AuditEvent.use_case_id == use_case_id)
+                .order_by(desc(AuditEvent.created_at))
+                .limit(limit)
+            )
         )
         return list((await self._session.execute(stmt)).scalars().all())
 
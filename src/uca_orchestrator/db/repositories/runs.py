@@ -11,10 +11,11 @@ Responsibilities:
 from __future__ import annotations
 
 import uuid
+from collections.abc import Mapping
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import desc, select
+from sqlalchemy import desc, lambda_stmt, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from uca_orchestrator.db.models import Run, RunStatus
@@ -43,11 +44,13 @@ class RunRepo:
         return await self._session.get(Run, run_id)
 
     async def latest_for_use_case(self, use_case_id: uuid.UUID) -> Run | None:
-        stmt = (
-            select(Run)
-            .where(Run.use_case_id == use_case_id)
-            .order_by(desc(Run.created_at))
-            .limit(1)
+        stmt = lambda_stmt(
+            lambda: (
+                select(Run)
+                .where(Run.use_case_id == use_case_id)
+                .order_by(desc(Run.created_at))
+                .limit(1)
+            )
         )
         return (await self._session.execute(stmt)).scalar_one_or_none()
 
@@ -56,29 +59,37 @@ class RunRepo:
         *,
         run_id: uuid.UUID,
         status: RunStatus | None = None,
-        state: dict[str, Any] | None = None,
+        state: Mapping[str, Any] | None = None,
         remediation_attempts: int | None = None,
         interrupted_reason: str | None = None,
         interrupted_payload: dict[str, Any] | None = None,
         error: str | None = None,
     ) -> None:
-        # Checkpoint/state updates are locked to avoid concurrent writers clobbering state.
-        run = await self._session.get(Run, run_id, with_for_update=True)
-        if run is None:
-            return
+        # Checkpoint/state updates are a single UPDATE (row-locked by the database for the
+        # statement) instead of SELECT ... FOR UPDATE + ORM flush; a missing run is a no-op.
+        # "evaluate" applies the same values to a Run already loaded in this session, so later
+        # `get` calls see the checkpoint without another SELECT.
+        # `state` is only read (serialized at execute time), so callers pass it without copying.
+        values: dict[str, Any] = {}
         if status is not None:
-            run.status = status
+            values["status"] = status
         if state is not None:
-            run.state = state
+            values["state"] = state
         if remediation_attempts is not None:
-            run.remediation_attempts = remediation_attempts
+            values["remediation_attempts"] = remediation_attempts
         if interrupted_reason is not None:
-            run.interrupted_reason = interrupted_reason
+            values["interrupted_reason"] = interrupted_reason
         if interrupted_payload is not None:
-            run.interrupted_payload = interrupted_payload
+            values["interrupted_payload"] = interrupted_payload
         if error is not None:
-            run.error = error
-        run.updated_at = datetime.utcnow()
+            values["error"] = error
+        stmt = (
+            update(Run)
+            .where(Run.id == run_id)
+            .values(**values, updated_at=datetime.utcnow())
+            .execution_options(synchronize_session="evaluate")
+        )
+        await self._session.execute(stmt)
 
 
 # --- Module Notes -----------------------------------------------------------
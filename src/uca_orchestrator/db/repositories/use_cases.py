@@ -11,13 +11,14 @@ Responsibilities:
 from __future__ import annotations
 
 import uuid
+from collections.abc import Sequence
 from datetime import datetime
-from typing import Any
+from typing import Any, cast
 
-from sqlalchemy import select
+from sqlalchemy import CursorResult, Row, desc, lambda_stmt, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from uca_orchestrator.db.models import UseCase, UseCaseStatus
+from uca_orchestrator.db.models import Artifact, AuditEvent, UseCase, UseCaseStatus
 
 
 class UseCaseRepo:
@@ -48,19 +49,129 @@ class UseCaseRepo:
         return uc
 
     async def get(self, use_case_id: uuid.UUID) -> UseCase | None:
+        # PK lookup via the identity map: a use case already loaded (or just created) in this
+        # session is returned without a SELECT.
         return await self._session.get(UseCase, use_case_id)
 
+    async def get_owner(self, use_case_id: uuid.UUID) -> str | None:
+        # Projected reads below skip the JSON snapshot columns when a caller needs one field.
+        stmt = lambda_stmt(lambda: select(UseCase.owner).where(UseCase.id == use_case_id))
+        # lambda_stmt erases the column type, so the annotated locals restore it.
+        owner: str | None = await self._session.scalar(stmt)
+        return owner
+
+    async def get_status(self, use_case_id: uuid.UUID) -> UseCaseStatus | None:
+        stmt = lambda_stmt(lambda: select(UseCase.status).where(UseCase.id == use_case_id))
+        status: UseCaseStatus | None = await self._session.scalar(stmt)
+        return status
+
+    async def get_classification(self, use_case_id: uuid.UUID) -> dict[str, Any] | None:
+        stmt = lambda_stmt(lambda: select(UseCase.classification).where(UseCase.id == use_case_id))
+        classification: dict[str, Any] | None = await self._session.scalar(stmt)
+        return classification
+
+    async def get_registration(
+        self, use_case_id: uuid.UUID
+    ) -> tuple[str | None, str, dict[str, Any]] | None:
+        # (external_use_case_id, owner, submission_payload) for the registration system.
+        stmt = lambda_stmt(
+            lambda: select(
+                UseCase.external_use_case_id, UseCase.owner, UseCase.submission_payload
+            ).where(UseCase.id == use_case_id)
+        )
+        row = (await self._session.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+        return row.external_use_case_id, row.owner, row.submission_payload
+
+    async def get_with_audit(
+        self, use_case_id: uuid.UUID, *, limit: int = 200
+    ) -> tuple[str, list[AuditEvent]] | None:
+        # One round-trip for owner + audit trail: LEFT JOIN, so a use case without events still
+        # yields one row (event None). Newest-first, same as AuditRepo.list_for_use_case.
+        stmt = lambda_stmt(
+            lambda: (
+                select(UseCase.owner, AuditEvent)
+                .outerjoin(AuditEvent, AuditEvent.use_case_id == UseCase.id)
+                .where(UseCase.id == use_case_id)
+                .order_by(desc(AuditEvent.created_at))
+                .limit(limit)
+            )
+        )
+        rows: Sequence[Row[str, AuditEvent | None]] = (await self._session.execute(stmt)).all()
+        if not rows:
+            return None
+        return rows[0][0], [ev for _, ev in rows if ev is not None]
+
+    async def get_with_artifacts(self, use_case_id: uuid.UUID) -> tuple[str, list[Artifact]] | None:
+        # Same LEFT JOIN shape as get_with_audit, for the artifact listing.
+        stmt = lambda_stmt(
+            lambda: (
+                select(UseCase.owner, Artifact)
+                .outerjoin(Artifact, Artifact.use_case_id == UseCase.id)
+                .where(UseCase.id == use_case_id)
+            )
+        )
+        rows: Sequence[Row[str, Artifact | None]] = (await self._session.execute(stmt)).all()
+        if not rows:
+            return None
+        return rows[0][0], [a for _, a in rows if a is not None]
+
+    async def get_approval_inputs(
+        self, use_case_id: uuid.UUID
+    ) -> tuple[list[str], dict[str, Any]] | None:
+        # Narrow read for the approvals system: (missing_artifacts, eval_metrics) only.
+        stmt = lambda_stmt(
+            lambda: select(UseCase.missing_artifacts, UseCase.eval_metrics).where(
+                UseCase.id == use_case_id
+            )
+        )
+        row = (await self._session.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+        return row.missing_artifacts, row.eval_metrics
+
+    async def get_eval_inputs(
+        self, use_case_id: uuid.UUID
+    ) -> tuple[dict[str, Any], dict[str, Any]] | None:
+        # Narrow read for the evaluations system: (classification, eval_metrics) only.
+        stmt = lambda_stmt(
+            lambda: select(UseCase.classification, UseCase.eval_metrics).where(
+                UseCase.id == use_case_id
+            )
+        )
+        row = (await self._session.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+        return row.classification, row.eval_metrics
+
     async def get_by_external_id(self, external_use_case_id: str) -> UseCase | None:
-        stmt = select(UseCase).where(UseCase.external_use_case_id == external_use_case_id)
+        stmt = lambda_stmt(
+            lambda: select(UseCase).where(UseCase.external_use_case_id == external_use_case_id)
+        )
         return (await self._session.execute(stmt)).scalar_one_or_none()
 
+    async def set_external_id(self, use_case_id: uuid.UUID, external_use_case_id: str) -> bool:
+        # Single UPDATE (no SELECT + ORM mutation); returns False when the use case is missing.
+        stmt = (
+            update(UseCase)
+            .where(UseCase.id == use_case_id)
+            .values(external_use_case_id=external_use_case_id, updated_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        result = cast(CursorResult[Any], await self._session.execute(stmt))
+        return result.rowcount > 0
+
     async def set_status(self, use_case_id: uuid.UUID, status: UseCaseStatus) -> None:
-        # with_for_update prevents lost updates when multiple orchestrations race.
-        uc = await self._session.get(UseCase, use_case_id, with_for_update=True)
-        if uc is None:
-            return
-        uc.status = status
-        uc.updated_at = datetime.utcnow()
+        # One UPDATE (atomic per row) instead of SELECT ... FOR UPDATE + ORM flush; a loaded
+        # UseCase in this session gets the new status too ("evaluate").
+        stmt = (
+            update(UseCase)
+            .where(UseCase.id == use_case_id)
+            .values(status=status, updated_at=datetime.utcnow())
+            .execution_options(synchronize_session="evaluate")
+        )
+        await self._session.execute(stmt)
 
     async def patch_governance_snapshot(
         self,
@@ -72,22 +183,30 @@ class UseCaseRepo:
         missing_artifacts: list[str] | None = None,
         risk_level: str | None = None,
     ) -> None:
-        # Snapshot writes are granular to reduce accidental overwrites.
-        uc = await self._session.get(UseCase, use_case_id, with_for_update=True)
-        if uc is None:
-            return
+        # Snapshot writes are granular to reduce accidental overwrites. A single UPDATE keeps
+        # this to one round-trip (no SELECT ... FOR UPDATE); a missing row is a no-op.
+        # Already-loaded UseCase instances in the session are not refreshed.
+        values: dict[str, Any] = {}
         if classification is not None:
-            uc.classification = classification
+            values["classification"] = classification
         if approval_status is not None:
-            uc.approval_status = approval_status
+            values["approval_status"] = approval_status
         if eval_metrics is not None:
-            uc.eval_metrics = eval_metrics
+            values["eval_metrics"] = eval_metrics
         if missing_artifacts is not None:
-            uc.missing_artifacts = missing_artifacts
+            values["missing_artifacts"] = missing_artifacts
         if risk_level is not None:
-            uc.risk_level = risk_level
-        uc.updated_at = datetime.utcnow()
+            values["risk_level"] = risk_level
+        stmt = (
+            update(UseCase)
+            .where(UseCase.id == use_case_id)
+            .values(**values, updated_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        await self._session.execute(stmt)
 
 
 # --- Module Notes -----------------------------------------------------------
 # This repo is called by internal dummy governance APIs and the orchestration service.
+# Hot SELECTs are built with `lambda_stmt`: construction and cache-key generation are done
+# once per code location, and later calls only re-bind the closure values as parameters.
@@ -5,15 +5,22 @@ Async SQLAlchemy engine + session factory helpers.
 
 Responsibilities:
 - Create the async engine from settings.
+- Serialize JSON/JSONB columns with orjson.
+- Tune SQLite connections (WAL, relaxed fsync, larger cache) for dev/test.
 - Create the async sessionmaker with safe defaults.
 - Provide a session scope helper for non-FastAPI contexts.
 """
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import AsyncIterator
+from typing import Any
 
+import orjson
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
@@ -23,13 +30,81 @@ from sqlalchemy.ext.asyncio import (
 from uca_orchestrator.settings import Settings
 
 
+def _is_sqlite(database_url: str) -> bool:
+    return database_url.startswith("sqlite")
+
+
+# Applied to every new SQLite connection. WAL lets readers run alongside the writer, and
+# synchronous=NORMAL skips the fsync per commit (safe under WAL: only the last commits can be
+# lost on power failure, never corrupted). foreign_keys is off by default in SQLite.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA foreign_keys=ON",
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def _json_dumps(value: Any) -> str:
+    # JSON/JSONB bind values go through orjson (C) instead of stdlib json; the drivers expect
+    # text, so decode. OPT_NON_STR_KEYS keeps stdlib json's tolerance for int keys.
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 def create_engine(settings: Settings) -> AsyncEngine:
     # pool_pre_ping helps detect stale connections in long-lived processes.
-    return create_async_engine(
+    pool_kwargs: dict[str, Any] = {}
+    if not _is_sqlite(settings.database_url):
+        # Size the pool for concurrent request load; the defaults (5 + 10 overflow) queue
+        # requests well before the database is saturated.
+        pool_kwargs = {
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_timeout": settings.db_pool_timeout,
+            "pool_recycle": settings.db_pool_recycle,
+        }
+    engine = create_async_engine(
         settings.database_url,
         pool_pre_ping=True,
         future=True,
+        # Headroom so every repo statement shape stays compiled (no LRU churn under load).
+        query_cache_size=settings.db_query_cache_size,
+        json_serializer=_json_dumps,
+        json_deserializer=orjson.loads,
+        **pool_kwargs,
+    )
+    if _is_sqlite(settings.database_url):
+        event.listen(engine.sync_engine, "connect", _apply_sqlite_pragmas)
+    return engine
+
+
+async def warm_pool(engine: AsyncEngine, size: int) -> None:
+    """
+    Open `size` connections concurrently and return them to the pool, so the first
+    requests after startup don't pay connection setup cost.
+    """
+
+    if size <= 0 or engine.dialect.name == "sqlite":
+        return
+    results = await asyncio.gather(
+        *(engine.connect().start() for _ in range(size)), return_exceptions=True
     )
+    # Return the connections that did open before surfacing a failure.
+    await asyncio.gather(*(r.close() for r in results if isinstance(r, AsyncConnection)))
+    for r in results:
+        if isinstance(r, BaseException):
+            raise r
 
 
 def create_sessionmaker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
@@ -0,0 +1,52 @@
+"""
+uca_orchestrator.governance_clients.base
+
+Client interface the orchestrator uses to call governance systems.
+
+Responsibilities:
+- Define the tool-call surface (registration, policy, approvals, evals, ...) as a Protocol.
+- Let the graph depend on the interface, not on a transport (HTTP vs in-process).
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import Any, Literal, Protocol
+
+
+class GovernanceClient(Protocol):
+    """
+    Each method returns the governance system's JSON payload as a plain dict.
+    Implementations: `InternalApiClient` (HTTP) and `InProcessApiClient` (direct calls).
+    """
+
+    async def registration_status(self, *, use_case_id: uuid.UUID) -> dict[str, Any]: ...
+
+    async def policy_requirements(
+        self,
+        *,
+        data_classification: Literal["PCI", "NON_PCI", "UNKNOWN"],
+        deployment_target: Literal["CLOUD", "ON_PREM", "UNKNOWN"],
+        model_provider: Literal["INTERNAL", "EXTERNAL", "UNKNOWN"],
+    ) -> dict[str, Any]: ...
+
+    async def approval_status(self, *, use_case_id: uuid.UUID) -> dict[str, Any]: ...
+
+    async def artifact_status(self, *, use_case_id: uuid.UUID) -> dict[str, Any]: ...
+
+    async def trigger_evaluations(
+        self, *, use_case_id: uuid.UUID, evaluations: list[str]
+    ) -> dict[str, Any]: ...
+
+    async def eval_status(self, *, use_case_id: uuid.UUID) -> dict[str, Any]: ...
+
+    async def netsec_baseline(self, *, use_case_id: uuid.UUID) -> dict[str, Any]: ...
+
+    async def firewall_check(self, *, use_case_id: uuid.UUID) -> dict[str, Any]: ...
+
+    async def hydra_readiness(self, *, use_case_id: uuid.UUID) -> dict[str, Any]: ...
+
+
+# --- Module Notes -----------------------------------------------------------
+# Swapping dummy systems for real services means adding an implementation here, not
+# touching orchestrator nodes.
@@ -0,0 +1,103 @@
+"""
+uca_orchestrator.governance_clients.in_process
+
+In-process client for the dummy governance systems hosted by this service.
+
+Responsibilities:
+- Call the internal system handlers as plain coroutines (no HTTP/ASGI round-trip).
+- Give each tool call its own DB session, mirroring per-request isolation over HTTP.
+- Return the same JSON-shaped dicts as `InternalApiClient`.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import Any, Literal
+
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+# `evaluations` is aliased because `trigger_evaluations` takes an `evaluations` argument.
+from uca_orchestrator.api.routers.internal.systems import (
+    approvals,
+    artifacts,
+    evaluations as eval_system,
+    firewall,
+    hydra,
+    netsec,
+    policy,
+    registration,
+)
+
+
+class InProcessApiClient:
+    """
+    Local boundary:
+    - The internal systems live in this process, so routing, RBAC, JWT minting and JSON
+      encode/decode per tool call are pure overhead; call the handlers directly instead.
+    - Errors surface as the handlers raise them (e.g. HTTPException 404).
+    """
+
+    def __init__(self, *, sessionmaker: async_sessionmaker[AsyncSession]) -> None:
+        self._sessionmaker = sessionmaker
+
+    async def _call(
+        self, handler: Callable[..., Awaitable[BaseModel]], **kwargs: Any
+    ) -> dict[str, Any]:
+        # Separate session per call: handlers commit their own writes, independently of the
+        # orchestration transaction (same as when they were served over HTTP).
+        async with self._sessionmaker() as session:
+            resp = await handler(session=session, **kwargs)
+        return resp.model_dump(mode="json")
+
+    async def registration_status(self, *, use_case_id: uuid.UUID) -> dict[str, Any]:
+        return await self._call(registration.get_registration_status, use_case_id=use_case_id)
+
+    async def policy_requirements(
+        self,
+        *,
+        data_classification: Literal["PCI", "NON_PCI", "UNKNOWN"],
+        deployment_target: Literal["CLOUD", "ON_PREM", "UNKNOWN"],
+        model_provider: Literal["INTERNAL", "EXTERNAL", "UNKNOWN"],
+    ) -> dict[str, Any]:
+        # Policy is pure (no DB access), so no session is opened.
+        body = policy.PolicyRequest(
+            data_classification=data_classification,
+            deployment_target=deployment_target,
+            model_provider=model_provider,
+        )
+        resp = await policy.get_policy_requirements(body)
+        return resp.model_dump(mode="json")
+
+    async def approval_status(self, *, use_case_id: uuid.UUID) -> dict[str, Any]:
+        return await self._call(approvals.get_approval_status, use_case_id=use_case_id)
+
+    async def artifact_status(self, *, use_case_id: uuid.UUID) -> dict[str, Any]:
+        return await self._call(artifacts.artifact_status, use_case_id=use_case_id)
+
+    async def trigger_evaluations(
+        self, *, use_case_id: uuid.UUID, evaluations: list[str]
+    ) -> dict[str, Any]:
+        return await self._call(
+            eval_system.trigger_evaluations,
+            use_case_id=use_case_id,
+            body=eval_system.TriggerEvalRequest(evaluations=evaluations),
+        )
+
+    async def eval_status(self, *, use_case_id: uuid.UUID) -> dict[str, Any]:
+        return await self._call(eval_system.get_eval_status, use_case_id=use_case_id)
+
+    async def netsec_baseline(self, *, use_case_id: uuid.UUID) -> dict[str, Any]:
+        return await self._call(netsec.netsec_baseline, use_case_id=use_case_id)
+
+    async def firewall_check(self, *, use_case_id: uuid.UUID) -> dict[str, Any]:
+        return await self._call(firewall.firewall_check, use_case_id=use_case_id)
+
+    async def hydra_readiness(self, *, use_case_id: uuid.UUID) -> dict[str, Any]:
+        return await self._call(hydra.hydra_readiness, use_case_id=use_case_id)
+
+
+# --- Module Notes -----------------------------------------------------------
+# `InternalApiClient` remains the HTTP implementation for when these systems are real
+# remote services; both satisfy `governance_clients.base.GovernanceClient`.
@@ -5,45 +5,174 @@ Structured logging configuration for the service.
 
 Responsibilities:
 - Configure `structlog` for JSON logs suitable for ELK/Splunk/Datadog.
+- Render and write log lines on a background thread (QueueHandler/QueueListener), or
+  inline while no listener is running.
 - Provide a small wrapper for obtaining bound loggers.
 """
 
 from __future__ import annotations
 
 import logging
+import queue
 import sys
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
+import orjson
 import structlog
 
+# Request-scoped log fields (request_id/path/method), set once per request by
+# `RequestContextMiddleware`. A single ContextVar holding a dict: one set/reset per request,
+# and one lookup per log event (structlog.contextvars keeps one ContextVar per key).
+REQUEST_CONTEXT: ContextVar[dict[str, Any] | None] = ContextVar("request_context", default=None)
 
-def configure_logging(*, service_name: str, level: str) -> None:
+
+# Bounded so records cannot pile up without limit; when full, the handler writes inline.
+_QUEUE_MAXSIZE = 10_000
+
+
+class _InProcessQueueHandler(QueueHandler):
+    """
+    Hands records to a `_LogQueueListener` thread while one is running, and writes them
+    inline otherwise (listener not started, already stopped, or queue full).
+    """
+
+    def __init__(self, log_queue: queue.Queue[logging.LogRecord], target: logging.Handler):
+        super().__init__(log_queue)
+        self._target = target
+        self.listening = False
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Runs on the logging thread. The queue never leaves the process, so skip
+        # QueueHandler's eager formatting (the ProcessorFormatter needs the original structlog
+        # event dict); only capture the request context, which the listener thread lacks.
+        ctx = REQUEST_CONTEXT.get()
+        if ctx:
+            record.uca_request_context = ctx
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.listening:
+            try:
+                self.queue.put_nowait(record)
+                return
+            except queue.Full:
+                pass
+        self._target.handle(record)
+
+
+class _LogQueueListener(QueueListener):
+    # Switches its handler between queued and inline writes, so nothing is enqueued while no
+    # thread is draining the queue. Records queued before `stop()` are still flushed by it.
+    def __init__(self, handler: _InProcessQueueHandler, target: logging.Handler) -> None:
+        super().__init__(handler.queue, target, respect_handler_level=True)
+        self._handler = handler
+
+    def start(self) -> None:
+        super().start()
+        self._handler.listening = True
+
+    def stop(self) -> None:
+        self._handler.listening = False
+        super().stop()
+
+
+def configure_logging(*, service_name: str, level: str) -> QueueListener:
     """
     Structured JSON logs for ingestion in Splunk/ELK/Datadog.
+
+    While the returned listener runs, callers only enqueue records; JSON rendering and the
+    stdout write happen on its thread. The caller owns the listener (start on startup, stop
+    on shutdown to flush); before start and after stop, records are written inline.
     """
 
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=getattr(logging, level.upper(), logging.INFO),
+    # structlog events run these on the calling thread, before `wrap_for_formatter`.
+    shared_processors: list[Any] = [
+        _merge_request_context,
+        structlog.stdlib.add_log_level,
+        structlog.stdlib.add_logger_name,
+        structlog.processors.TimeStamper(fmt="iso", utc=True),
+        structlog.processors.dict_tracebacks,
+    ]
+    # stdlib records (uvicorn, sqlalchemy) are processed where they are rendered, i.e. on the
+    # listener thread: take request context and time from the record, not from that thread.
+    foreign_pre_chain: list[Any] = [
+        _merge_record_context,
+        structlog.stdlib.add_log_level,
+        structlog.stdlib.add_logger_name,
+        _record_timestamp,
+        structlog.processors.dict_tracebacks,
+        # These records have no structlog context to carry "service".
+        _add_service_name(service_name),
+    ]
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(
+        structlog.stdlib.ProcessorFormatter(
+            processors=[
+                structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+                structlog.processors.JSONRenderer(serializer=_orjson_dumps),
+            ],
+            foreign_pre_chain=foreign_pre_chain,
+        )
     )
 
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=_QUEUE_MAXSIZE)
+    handler = _InProcessQueueHandler(log_queue, stream_handler)
+    root = logging.getLogger()
+    # Replace only a handler installed by an earlier call; keep handlers owned by others
+    # (pytest's caplog, an embedding application).
+    for existing in [h for h in root.handlers if isinstance(h, _InProcessQueueHandler)]:
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(getattr(logging, level.upper(), logging.INFO))
+
     # structlog processors run on each log event; keep this list focused and stable.
     structlog.configure(
-        processors=[
-            structlog.contextvars.merge_contextvars,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.add_logger_name,
-            structlog.processors.TimeStamper(fmt="iso", utc=True),
-            _add_service_name(service_name),
-            structlog.processors.dict_tracebacks,
-            structlog.processors.JSONRenderer(),
-        ],
+        processors=[*shared_processors, structlog.stdlib.ProcessorFormatter.wrap_for_formatter],
         logger_factory=structlog.stdlib.LoggerFactory(),
         wrapper_class=structlog.stdlib.BoundLogger,
+        # "service" is part of every structlog logger's initial context, so it rides along
+        # with the per-event context copy instead of costing a processor call per event.
+        context_class=_service_context(service_name),
         cache_logger_on_first_use=True,
     )
 
+    return _LogQueueListener(handler, stream_handler)
+
+
+def _merge_request_context(_: Any, __: str, event_dict: dict[str, Any]) -> dict[str, Any]:
+    # Event fields win over request context (same precedence as merge_contextvars).
+    ctx = REQUEST_CONTEXT.get()
+    if not ctx:
+        return event_dict
+    return {**ctx, **event_dict}
+
+
+def _merge_record_context(_: Any, __: str, event_dict: dict[str, Any]) -> dict[str, Any]:
+    # Foreign-record counterpart of `_merge_request_context`: the context captured by
+    # `_InProcessQueueHandler.prepare` on the logging thread.
+    ctx = getattr(event_dict.get("_record"), "uca_request_context", None)
+    if not ctx:
+        return event_dict
+    return {**ctx, **event_dict}
+
+
+def _record_timestamp(_: Any, __: str, event_dict: dict[str, Any]) -> dict[str, Any]:
+    # Same format as TimeStamper(fmt="iso", utc=True), from the record's creation time.
+    record: logging.LogRecord = event_dict["_record"]
+    ts = datetime.fromtimestamp(record.created, tz=UTC).isoformat()
+    event_dict["timestamp"] = ts.replace("+00:00", "Z")
+    return event_dict
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    # orjson is C-level (and natively handles UUID/datetime); logging.Formatter must return
+    # str, so decode. OPT_NON_STR_KEYS keeps stdlib json's tolerance for int/None keys.
+    return orjson.dumps(obj, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS).decode()
+
 
 def _add_service_name(service_name: str):
     # Adds a stable "service" field for log routing/aggregation across environments.
@@ -54,9 +183,22 @@ def _add_service_name(service_name: str):
     return processor
 
 
+def _service_context(service_name: str) -> type[dict[str, Any]]:
+    # Context class: instantiated when a logger is first bound, not per event. Bound values win
+    # over the default, like the `setdefault` in `_add_service_name`.
+    class ServiceContext(dict[str, Any]):
+        # `bind()` rebuilds the context as `cls(ctx, **new_values)`.
+        def __init__(self, values: dict[str, Any] | None = None, **kw: Any) -> None:
+            super().__init__(service=service_name)
+            self.update(values or {}, **kw)
+
+    return ServiceContext
+
+
 def get_logger(name: str) -> structlog.stdlib.BoundLogger:
     return structlog.get_logger(name)
 
 
 # --- Module Notes -----------------------------------------------------------
-# Request-scoped metadata is bound via contextvars in `observability.middleware`.
+# Request-scoped metadata is set via `REQUEST_CONTEXT` in `observability.middleware`;
+# structlog.contextvars.bind_contextvars is not merged into log events.
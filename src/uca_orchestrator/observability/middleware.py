@@ -5,42 +5,89 @@ HTTP middleware for request-scoped logging context.
 
 Responsibilities:
 - Generate/propagate request IDs.
-- Bind request metadata into structlog contextvars.
+- Set request metadata as the request-scoped log context.
 """
 
 from __future__ import annotations
 
-import uuid
+import os
 
-import structlog
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from uca_orchestrator.observability.logging import REQUEST_CONTEXT
 
-class RequestContextMiddleware(BaseHTTPMiddleware):
+_REQUEST_ID_HEADER = b"x-request-id"
+
+# Random bytes for 256 request ids per os.urandom call (one syscall instead of one per id).
+# Only touched from the event loop thread.
+_ID_POOL_SIZE = 16 * 256
+_id_pool = b""
+_id_pool_pos = 0
+
+
+def _new_request_id() -> str:
+    # Same format as str(uuid.uuid4()), without a syscall and UUID object per request.
+    global _id_pool, _id_pool_pos
+    if _id_pool_pos >= len(_id_pool):
+        _id_pool = os.urandom(_ID_POOL_SIZE)
+        _id_pool_pos = 0
+    b = bytearray(_id_pool[_id_pool_pos : _id_pool_pos + 16])
+    _id_pool_pos += 16
+    b[6] = (b[6] & 0x0F) | 0x40  # version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+class RequestContextMiddleware:
     """
     - Ensures every request has a request id
-    - Binds request-scoped contextvars for structured logs
+    - Sets the request-scoped log context for structured logs
+
+    Plain ASGI (not BaseHTTPMiddleware): reads the raw scope and sets one response
+    header, with no per-request task group, stream pair or Request/Response objects.
     """
 
-    async def dispatch(self, request: Request, call_next) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Prefer a caller-provided request id for trace continuity; otherwise generate one.
-        request_id = request.headers.get("x-request-id") or str(uuid.uuid4())
-        structlog.contextvars.clear_contextvars()
-        structlog.contextvars.bind_contextvars(
-            request_id=request_id,
-            path=request.url.path,
-            method=request.method,
+        raw_id = None
+        for name, value in scope["headers"]:
+            if name == _REQUEST_ID_HEADER:
+                raw_id = value
+                break
+        if raw_id:
+            request_id = raw_id.decode("latin-1")
+        else:
+            request_id = _new_request_id()
+            raw_id = request_id.encode("latin-1")
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Replace any id set downstream so the response carries exactly one.
+                headers = [
+                    (name, value)
+                    for name, value in message.get("headers", ())
+                    if name.lower() != _REQUEST_ID_HEADER
+                ]
+                headers.append((_REQUEST_ID_HEADER, raw_id))
+                message["headers"] = headers
+            await send(message)
+
+        token = REQUEST_CONTEXT.set(
+            {"request_id": request_id, "path": scope["path"], "method": scope["method"]}
         )
         try:
-            response: Response = await call_next(request)
+            await self.app(scope, receive, send_with_request_id)
         finally:
             # Avoid leaking context across requests under async concurrency.
-            structlog.contextvars.clear_contextvars()
-
-        response.headers["x-request-id"] = request_id
-        return response
+            REQUEST_CONTEXT.reset(token)
 
 
 # --- Module Notes -----------------------------------------------------------
@@ -11,9 +11,9 @@ Responsibilities:
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Hashable
 
-from uca_orchestrator.governance_clients.internal_http import InternalApiClient
+from uca_orchestrator.governance_clients.base import GovernanceClient
 from uca_orchestrator.orchestrator.nodes import (
     approval_check_node,
     artifact_generation_node,
@@ -35,80 +35,101 @@ from uca_orchestrator.orchestrator.nodes import (
 )
 from uca_orchestrator.orchestrator.state import UseCaseState
 
+# Imported once at module load; `build_graph` reports a missing install at call time.
+try:
+    from langgraph.graph import END, StateGraph  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover
+    END = StateGraph = None  # type: ignore[assignment,misc]
+
+# Node registration tables: names are referenced by conditional edge routing.
+_PLAIN_NODES: tuple[tuple[str, Callable[..., Awaitable[UseCaseState]]], ...] = (
+    ("entry", entry_node),
+    ("classify", classify_node),
+    ("gap_analysis", gap_analysis_node),
+    ("artifact_generation", artifact_generation_node),
+    ("remediation", remediation_node),
+)
+# Nodes that call governance systems get the client bound in.
+# True fan-out fetch nodes (parallelism handled by LangGraph scheduler).
+_CLIENT_NODES: tuple[tuple[str, Callable[..., Awaitable[UseCaseState]]], ...] = (
+    ("fetch_registration", fetch_registration_node),
+    ("fetch_policy", fetch_policy_node),
+    ("fetch_approvals", fetch_approvals_node),
+    ("fetch_eval_status", fetch_eval_status_node),
+    ("fetch_artifacts_status", fetch_artifacts_status_node),
+    ("eval_check", eval_check_node),
+    ("approval_check", approval_check_node),
+)
 
-def build_graph(*, client: InternalApiClient, max_attempts: int):
-    """
-    Returns a compiled LangGraph runnable.
-    """
-
-    try:
-        from langgraph.graph import END, StateGraph  # type: ignore[import-not-found]
-    except Exception as e:  # pragma: no cover
-        raise RuntimeError(
-            "LangGraph is not available. Install dependencies (see requirements.txt)."
-        ) from e
-
-    graph = StateGraph(UseCaseState)
-
-    # Node registration: names are referenced by conditional edge routing.
-    graph.add_node("entry", entry_node)
-    graph.add_node("classify", classify_node)
-    # True fan-out fetch nodes (parallelism handled by LangGraph scheduler).
-    graph.add_node("fetch_registration", _bind_client(fetch_registration_node, client))
-    graph.add_node("fetch_policy", _bind_client(fetch_policy_node, client))
-    graph.add_node("fetch_approvals", _bind_client(fetch_approvals_node, client))
-    graph.add_node("fetch_eval_status", _bind_client(fetch_eval_status_node, client))
-    graph.add_node("fetch_artifacts_status", _bind_client(fetch_artifacts_status_node, client))
-    graph.add_node("gap_analysis", gap_analysis_node)
-    graph.add_node("artifact_generation", artifact_generation_node)
-    graph.add_node("eval_check", _bind_client(eval_check_node, client))
-    graph.add_node("approval_check", _bind_client(approval_check_node, client))
-    graph.add_node("remediation", remediation_node)
-    graph.add_node("escalation", _bind_max_attempts(escalation_node, max_attempts))
-    graph.add_node("finish", _finish_node)
-
-    graph.set_entry_point("entry")
+_FETCH_NODES = (
+    "fetch_registration",
+    "fetch_policy",
+    "fetch_approvals",
+    "fetch_eval_status",
+    "fetch_artifacts_status",
+)
 
-    graph.add_edge("entry", "classify")
+# Static topology, shared by every compile.
+_EDGES: tuple[tuple[str, str], ...] = (
+    ("entry", "classify"),
     # Fan-out from classify into fetch nodes.
-    graph.add_edge("classify", "fetch_registration")
-    graph.add_edge("classify", "fetch_policy")
-    graph.add_edge("classify", "fetch_approvals")
-    graph.add_edge("classify", "fetch_eval_status")
-    graph.add_edge("classify", "fetch_artifacts_status")
-
+    *(("classify", name) for name in _FETCH_NODES),
     # Fan-in barrier: gap_analysis waits for all predecessors to complete.
-    graph.add_edge("fetch_registration", "gap_analysis")
-    graph.add_edge("fetch_policy", "gap_analysis")
-    graph.add_edge("fetch_approvals", "gap_analysis")
-    graph.add_edge("fetch_eval_status", "gap_analysis")
-    graph.add_edge("fetch_artifacts_status", "gap_analysis")
-
-    graph.add_conditional_edges(
+    *((name, "gap_analysis") for name in _FETCH_NODES),
+    ("artifact_generation", "eval_check"),
+    ("remediation", "escalation"),
+)
+# Path maps are typed `dict[Hashable, str]` to match `StateGraph.add_conditional_edges`.
+_CONDITIONAL_EDGES: tuple[
+    tuple[str, Callable[[UseCaseState], str], dict[Hashable, str]], ...
+] = (
+    (
         "gap_analysis",
         route_after_gap,
         {"artifact_generation": "artifact_generation", "eval_check": "eval_check"},
-    )
-    graph.add_edge("artifact_generation", "eval_check")
-
-    graph.add_conditional_edges(
+    ),
+    (
         "eval_check",
         route_after_eval,
         {"remediation": "remediation", "approval_check": "approval_check"},
-    )
-    graph.add_conditional_edges(
+    ),
+    (
         "approval_check",
         route_after_approval,
         {"remediation": "remediation", "finish": "finish"},
-    )
-
-    graph.add_edge("remediation", "escalation")
-    graph.add_conditional_edges(
+    ),
+    (
         "escalation",
         route_after_remediation,
         {"artifact_generation": "artifact_generation", "eval_check": "eval_check"},
-    )
+    ),
+)
+
+
+def build_graph(*, client: GovernanceClient, max_attempts: int):
+    """
+    Returns a compiled LangGraph runnable.
+    """
 
+    if StateGraph is None:  # pragma: no cover
+        raise RuntimeError(
+            "LangGraph is not available. Install dependencies (see requirements.txt)."
+        )
+
+    graph = StateGraph(UseCaseState)
+
+    for name, fn in _PLAIN_NODES:
+        graph.add_node(name, fn)
+    for name, fn in _CLIENT_NODES:
+        graph.add_node(name, _bind_client(fn, client))
+    graph.add_node("escalation", _bind_max_attempts(escalation_node, max_attempts))
+    graph.add_node("finish", _finish_node)
+
+    graph.set_entry_point("entry")
+    for source, target in _EDGES:
+        graph.add_edge(source, target)
+    for source, route, path_map in _CONDITIONAL_EDGES:
+        graph.add_conditional_edges(source, route, path_map)
     graph.add_edge("finish", END)
 
     return graph.compile()
@@ -116,7 +137,7 @@ def build_graph(*, client: InternalApiClient, max_attempts: int):
 
 def _bind_client(
     fn: Callable[..., Awaitable[UseCaseState]],
-    client: InternalApiClient,
+    client: GovernanceClient,
 ) -> Callable[[UseCaseState], Awaitable[UseCaseState]]:
     async def _wrapped(state: UseCaseState) -> UseCaseState:
         return await fn(state, client=client)
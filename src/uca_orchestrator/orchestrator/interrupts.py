@@ -9,19 +9,24 @@ Responsibilities:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass(frozen=True, slots=True)
 class HumanInterrupt(Exception):
     """
     Raised by the graph when a human decision is required.
     The API layer persists the payload and exposes a resume endpoint.
     """
 
-    reason: str
-    payload: dict[str, Any]
+    # Plain Exception subclass, not a frozen slotted dataclass: that variant's __setattr__
+    # raised TypeError when contextlib re-assigned __traceback__ while the interrupt
+    # propagated out of LangGraph, and it never passed `args` to Exception.
+    __slots__ = ("payload", "reason")
+
+    def __init__(self, reason: str, payload: dict[str, Any]) -> None:
+        super().__init__(reason)
+        self.reason = reason
+        self.payload = payload
 
 
 # --- Module Notes -----------------------------------------------------------
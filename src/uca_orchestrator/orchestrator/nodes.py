@@ -14,9 +14,10 @@ Responsibilities:
 from __future__ import annotations
 
 import uuid
+from functools import lru_cache
 from typing import Any, Literal
 
-from uca_orchestrator.governance_clients.internal_http import InternalApiClient
+from uca_orchestrator.governance_clients.base import GovernanceClient
 from uca_orchestrator.orchestrator.interrupts import HumanInterrupt
 from uca_orchestrator.orchestrator.state import UseCaseState
 
@@ -29,6 +30,24 @@ def _audit(event: str, details: dict[str, Any]) -> list[dict[str, Any]]:
     return [{"event": event, "details": details}]
 
 
+# Defaults for keys absent from the initial state. Shared across runs: list defaults are
+# tuples, and no node mutates a state container in place (nodes copy before changing).
+_ENTRY_DEFAULTS: dict[str, Any] = {
+    "submission_payload": {},
+    "classification": {},
+    "missing_artifacts": (),
+    "approval_status": {},
+    "eval_metrics": {},
+    "policy": {},
+    "artifact_types_present": (),
+    "risk_level": "UNKNOWN",
+    "remediation_attempts": 0,
+    "escalation_required": False,
+    "eval_failed": None,
+    "approval_rejected": None,
+}
+
+
 async def entry_node(state: UseCaseState) -> UseCaseState:
     """
     Spec alignment:
@@ -42,22 +61,21 @@ async def entry_node(state: UseCaseState) -> UseCaseState:
         raise ValueError("submission_payload must be a dict")
 
     # Entry initializes stable defaults. This node runs first, so overwrites are safe.
-    return {
-        "use_case_id": state["use_case_id"],
-        "submission_payload": state.get("submission_payload", {}),
-        "classification": state.get("classification", {}),
-        "missing_artifacts": state.get("missing_artifacts", []),
-        "approval_status": state.get("approval_status", {}),
-        "eval_metrics": state.get("eval_metrics", {}),
-        "policy": state.get("policy", {}),
-        "artifact_types_present": state.get("artifact_types_present", []),
-        "risk_level": state.get("risk_level", "UNKNOWN"),
-        "remediation_attempts": int(state.get("remediation_attempts", 0) or 0),
-        "escalation_required": bool(state.get("escalation_required", False)),
-        "eval_failed": state.get("eval_failed"),
-        "approval_rejected": state.get("approval_rejected"),
-        "audit_log": _audit("ENTRY", {}),
-    }
+    out: dict[str, Any] = {**_ENTRY_DEFAULTS}
+    for key in _ENTRY_DEFAULTS:
+        if key in state:
+            out[key] = state[key]  # type: ignore[literal-required]
+    out["use_case_id"] = state["use_case_id"]
+    out["remediation_attempts"] = int(out["remediation_attempts"] or 0)
+    out["escalation_required"] = bool(out["escalation_required"])
+    out["audit_log"] = _audit("ENTRY", {})
+    return out  # type: ignore[return-value]
+
+
+# Risk rules: any HIGH trigger wins, then MEDIUM, else LOW.
+_HIGH_RISK_DATA = frozenset({"PCI"})
+_HIGH_RISK_PROVIDERS = frozenset({"EXTERNAL"})
+_MEDIUM_RISK_TARGETS = frozenset({"CLOUD"})
 
 
 async def classify_node(state: UseCaseState) -> UseCaseState:
@@ -68,11 +86,12 @@ async def classify_node(state: UseCaseState) -> UseCaseState:
     deployment_target = (payload.get("deployment_target") or "UNKNOWN").upper()
     model_provider = (payload.get("model_provider") or "UNKNOWN").upper()
 
-    risk = "LOW"
-    if data_classification == "PCI" or model_provider == "EXTERNAL":
+    if data_classification in _HIGH_RISK_DATA or model_provider in _HIGH_RISK_PROVIDERS:
         risk = "HIGH"
-    elif deployment_target == "CLOUD":
+    elif deployment_target in _MEDIUM_RISK_TARGETS:
         risk = "MEDIUM"
+    else:
+        risk = "LOW"
 
     classification = {
         "data_classification": data_classification,
@@ -85,14 +104,14 @@ async def classify_node(state: UseCaseState) -> UseCaseState:
         "audit_log": _audit("CLASSIFY", {"risk_level": risk, **classification}),
     }
 
-async def fetch_registration_node(state: UseCaseState, *, client: InternalApiClient) -> UseCaseState:
+async def fetch_registration_node(state: UseCaseState, *, client: GovernanceClient) -> UseCaseState:
     use_case_id = state["use_case_id"]
     reg = await client.registration_status(use_case_id=_uuid(use_case_id))
     payload = reg.get("submission_payload", {})
     return {"submission_payload": payload, "audit_log": _audit("FETCH_REGISTRATION", {})}
 
 
-async def fetch_policy_node(state: UseCaseState, *, client: InternalApiClient) -> UseCaseState:
+async def fetch_policy_node(state: UseCaseState, *, client: GovernanceClient) -> UseCaseState:
     cls = state.get("classification", {})
     policy = await client.policy_requirements(
         data_classification=_lit(str(cls.get("data_classification", "UNKNOWN"))),
@@ -102,74 +121,93 @@ async def fetch_policy_node(state: UseCaseState, *, client: InternalApiClient) -
     return {"policy": policy, "audit_log": _audit("FETCH_POLICY", {"meta": policy.get("meta", {})})}
 
 
-async def fetch_approvals_node(state: UseCaseState, *, client: InternalApiClient) -> UseCaseState:
+async def fetch_approvals_node(state: UseCaseState, *, client: GovernanceClient) -> UseCaseState:
     use_case_id = state["use_case_id"]
     approvals = await client.approval_status(use_case_id=_uuid(use_case_id))
-    snapshot = _normalize_approval_snapshot(approvals)
-    return {"approval_status": snapshot, "audit_log": _audit("FETCH_APPROVALS", {})}
+    snapshot, _ = _normalize_approval_snapshot(approvals)
+    return {
+        "approval_status": snapshot,
+        "approval_status_fresh": True,
+        "audit_log": _audit("FETCH_APPROVALS", {}),
+    }
 
 
-async def fetch_eval_status_node(state: UseCaseState, *, client: InternalApiClient) -> UseCaseState:
+async def fetch_eval_status_node(state: UseCaseState, *, client: GovernanceClient) -> UseCaseState:
     use_case_id = state["use_case_id"]
     evals = await client.eval_status(use_case_id=_uuid(use_case_id))
     metrics = evals.get("eval_metrics", {})
     return {"eval_metrics": metrics, "audit_log": _audit("FETCH_EVAL_STATUS", {})}
 
 
-async def fetch_artifacts_status_node(state: UseCaseState, *, client: InternalApiClient) -> UseCaseState:
+async def fetch_artifacts_status_node(state: UseCaseState, *, client: GovernanceClient) -> UseCaseState:
     use_case_id = state["use_case_id"]
     artifacts = await client.artifact_status(use_case_id=_uuid(use_case_id))
     present = list(artifacts.get("artifact_types", []))
     return {"artifact_types_present": present, "audit_log": _audit("FETCH_ARTIFACT_STATUS", {})}
 
 
-def _normalize_approval_snapshot(approvals_resp: dict[str, Any]) -> dict[str, Any]:
-    # Internal dummy returns {"approvals": [{"system":..., "state":...}, ...]}
+# Approval state as emitted by the approvals system (a str Literal; StrEnums compare equal).
+_REJECTED = "REJECTED"
+
+
+def _normalize_approval_snapshot(
+    approvals_resp: dict[str, Any],
+) -> tuple[dict[str, Any], list[str]]:
+    # Internal dummy returns {"approvals": [{"system":..., "state":...}, ...]} with one item
+    # per system. Returns (snapshot by system, rejected systems) in a single pass.
     items = approvals_resp.get("approvals", [])
     out: dict[str, Any] = {}
+    rejected: list[str] = []
     if isinstance(items, list):
         for it in items:
             system = str(it.get("system", "UNKNOWN"))
-            out[system] = {"state": it.get("state"), "comment": it.get("comment")}
-    return out
+            state = it.get("state")
+            out[system] = {"state": state, "comment": it.get("comment")}
+            if state == _REJECTED:
+                rejected.append(system)
+    return out, rejected
 
 
 async def gap_analysis_node(state: UseCaseState) -> UseCaseState:
     # Compare policy requirements to the artifact types present in persistence.
     policy = state.get("policy", {})
-    required = list(policy.get("required_artifacts", []))
-    missing: list[str] = []
-
+    required = policy.get("required_artifacts") or ()
     present = set(state.get("artifact_types_present", []))
-    for a in required:
-        if str(a) in present:
-            continue
-        missing.append(str(a))
+    # Keeps policy order (a set difference would not), so audit details stay stable.
+    missing = [a for a in map(str, required) if a not in present]
 
     return {"missing_artifacts": missing, "audit_log": _audit("GAP_ANALYSIS", {"required": required, "missing": missing})}
 
 
 async def artifact_generation_node(state: UseCaseState) -> UseCaseState:
     # Dummy artifact generation. In production, this would call an LLM or template engine.
-    missing = list(state.get("missing_artifacts", []))
-    generated = {}
-    for art in missing:
-        generated[art] = _generate_artifact(artifact_type=art, state=state)
+    missing = state.get("missing_artifacts") or ()
+    if not missing:
+        # Reachable via remediation routing with nothing to generate.
+        return {
+            "generated_artifacts": {},
+            "missing_artifacts": [],
+            "audit_log": _audit("ARTIFACT_GENERATION", {"generated": []}),
+        }
+
+    # Only the title differs per artifact: render the shared body (which formats the
+    # classification and submission dicts) once per node run, not once per artifact.
+    body = _artifact_body(state)
+    generated = {art: f"# {art}\n\n{body}" for art in missing}
 
     # Note: missing_artifacts is cleared after generation in this dummy system.
     return {
         "generated_artifacts": generated,
         "missing_artifacts": [],
-        "audit_log": _audit("ARTIFACT_GENERATION", {"generated": list(generated.keys())}),
+        "audit_log": _audit("ARTIFACT_GENERATION", {"generated": list(generated)}),
     }
 
 
-def _generate_artifact(*, artifact_type: str, state: UseCaseState) -> str:
+def _artifact_body(state: UseCaseState) -> str:
     ucid = state.get("use_case_id", "unknown")
     cls = state.get("classification", {})
     payload = state.get("submission_payload", {})
     return (
-        f"# {artifact_type}\n\n"
         f"## Use Case\n- ID: `{ucid}`\n\n"
         f"## Classification\n- {cls}\n\n"
         f"## Submission Snapshot\n- {payload}\n\n"
@@ -178,13 +216,16 @@ def _generate_artifact(*, artifact_type: str, state: UseCaseState) -> str:
     )
 
 
-async def eval_check_node(state: UseCaseState, *, client: InternalApiClient) -> UseCaseState:
+async def eval_check_node(state: UseCaseState, *, client: GovernanceClient) -> UseCaseState:
     # Ensure all required evaluations are present; trigger missing ones.
     policy = state.get("policy", {})
-    required_evals = list(policy.get("required_evaluations", []))
+    required_evals = policy.get("required_evaluations") or ()
     metrics = dict(state.get("eval_metrics", {}))
 
-    missing_evals = [e for e in required_evals if _metric_key(e) not in metrics]
+    # Inlined metric-key lookup (see `_METRIC_KEYS`): no helper call per evaluation.
+    missing_evals = [
+        e for e in required_evals if (_METRIC_KEYS.get(e) or e.lower()) not in metrics
+    ]
     if missing_evals:
         resp = await client.trigger_evaluations(
             use_case_id=_uuid(state["use_case_id"]), evaluations=missing_evals
@@ -203,29 +244,35 @@ async def eval_check_node(state: UseCaseState, *, client: InternalApiClient) ->
         failed = None
         status_audit = _audit("EVAL_OK", {"toxicity": toxicity})
 
-    return {
+    out: UseCaseState = {
         "eval_metrics": metrics,
         "eval_failed": failed,
-        "audit_log": [*eval_audit, *status_audit],
+        "audit_log": [*eval_audit, *status_audit] if eval_audit else status_audit,
     }
+    if missing_evals:
+        # New metrics feed the approvals system's risk rule, so the snapshot is stale.
+        out["approval_status_fresh"] = False
+    return out
 
 
-def _metric_key(eval_name: str) -> str:
-    if eval_name == "TOXICITY":
-        return "toxicity"
-    if eval_name == "PROMPT_INJECTION":
-        return "prompt_injection"
-    if eval_name == "REDACTABILITY":
-        return "redactability"
-    return eval_name.lower()
+# Evaluation name -> metric key in `eval_metrics`; unknown names fall back to lower-case.
+_METRIC_KEYS = {
+    "TOXICITY": "toxicity",
+    "PROMPT_INJECTION": "prompt_injection",
+    "REDACTABILITY": "redactability",
+}
 
 
-async def approval_check_node(state: UseCaseState, *, client: InternalApiClient) -> UseCaseState:
-    # Evaluate governance approval status and determine if any systems rejected.
-    resp = await client.approval_status(use_case_id=_uuid(state["use_case_id"]))
-    snapshot = _normalize_approval_snapshot(resp)
+async def approval_check_node(state: UseCaseState, *, client: GovernanceClient) -> UseCaseState:
+    # Evaluate governance approval status and determine if any systems rejected. Reuse the
+    # fan-out fetch when nothing that feeds the approvals system has changed since.
+    snapshot = state.get("approval_status")
+    if snapshot and state.get("approval_status_fresh"):
+        rejected = [k for k, v in snapshot.items() if v.get("state") == _REJECTED]
+    else:
+        resp = await client.approval_status(use_case_id=_uuid(state["use_case_id"]))
+        snapshot, rejected = _normalize_approval_snapshot(resp)
 
-    rejected = [k for k, v in snapshot.items() if str(v.get("state")) == "REJECTED"]
     if rejected:
         approval_rejected = {"systems": rejected}
         audit = _audit("APPROVAL_REJECTED", {"systems": rejected})
@@ -241,16 +288,24 @@ async def remediation_node(state: UseCaseState) -> UseCaseState:
     attempts = int(state.get("remediation_attempts", 0) or 0) + 1
 
     # Dummy remediation: if eval failed toxicity, add a firewall rules artifact request
-    missing = list(state.get("missing_artifacts", []))
+    missing = state.get("missing_artifacts") or []
     if state.get("eval_failed"):
-        missing = list(dict.fromkeys([*missing, "AI_FIREWALL_RULES"]))
+        if "AI_FIREWALL_RULES" not in missing:
+            # New list rather than append: the incoming one belongs to the previous state.
+            missing = [*missing, "AI_FIREWALL_RULES"]
         audit = _audit(
             "REMEDIATION_PLANNED", {"attempt": attempts, "action": "add_ai_firewall_rules"}
         )
     else:
         audit = _audit("REMEDIATION_PLANNED", {"attempt": attempts, "action": "noop"})
 
-    return {"remediation_attempts": attempts, "missing_artifacts": missing, "audit_log": audit}
+    return {
+        "remediation_attempts": attempts,
+        "missing_artifacts": missing,
+        # Post-remediation approval checks must refetch.
+        "approval_status_fresh": False,
+        "audit_log": audit,
+    }
 
 
 async def escalation_node(state: UseCaseState, *, max_attempts: int) -> UseCaseState:
@@ -295,19 +350,20 @@ def route_after_remediation(state: UseCaseState) -> str:
     return "eval_check"
 
 
+@lru_cache(maxsize=1024)
 def _uuid(v: str) -> uuid.UUID:
-    import uuid as _uuid_mod
-
-    return _uuid_mod.UUID(v)
+    # State carries the id as a string (it must survive checkpointing); every client-calling
+    # node converts it, so parse each id once. UUIDs are immutable, so sharing is safe.
+    return uuid.UUID(v)
 
 
 def _lit(
     v: str,
 ) -> Literal["PCI", "NON_PCI", "UNKNOWN", "CLOUD", "ON_PREM", "INTERNAL", "EXTERNAL"]:
-    # Type helper for InternalApiClient signature; runtime is just strings.
+    # Type helper for GovernanceClient signatures; runtime is just strings.
     return v  # type: ignore[return-value]
 
 
 # --- Module Notes -----------------------------------------------------------
 # Nodes should not perform DB writes directly; persistence is owned by the service layer.
-# Tool calls are mediated through `InternalApiClient` to preserve a stable integration boundary.
+# Tool calls are mediated through `GovernanceClient` to preserve a stable integration boundary.
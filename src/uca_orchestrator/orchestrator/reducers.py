@@ -10,11 +10,12 @@ Why reducers:
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Any
 
 
 def append_audit(
-    left: list[dict[str, Any]] | None, right: list[dict[str, Any]] | None
+    left: Sequence[dict[str, Any]] | None, right: Sequence[dict[str, Any]] | None
 ) -> list[dict[str, Any]]:
     """
     Append-only reducer for audit log entries.
@@ -22,11 +23,9 @@ def append_audit(
     Nodes should return `{"audit_log": [event]}` and this reducer will concatenate safely.
     """
 
-    if not left:
-        return list(right or [])
     if not right:
-        return list(left)
-    return [*left, *right]
+        return list(left or [])
+    return [*(left or ()), *right]
 
 
 def merge_dicts(
@@ -10,7 +10,8 @@ Responsibilities:
 
 from __future__ import annotations
 
-from typing import Annotated, Any, TypedDict
+from collections.abc import Callable, Mapping
+from typing import Annotated, Any, TypedDict, get_type_hints
 
 from uca_orchestrator.orchestrator.reducers import append_audit, merge_dicts
 
@@ -44,6 +45,9 @@ class UseCaseState(TypedDict, total=False):
     # Derived control flags (kept explicit for routing)
     eval_failed: dict[str, Any] | None
     approval_rejected: dict[str, Any] | None
+    # True while `approval_status` still matches the approvals system (no eval/remediation
+    # writes since it was fetched); lets approval_check skip a refetch.
+    approval_status_fresh: bool
 
     # Audit
     audit_log: Annotated[list[dict[str, Any]], append_audit]
@@ -55,6 +59,29 @@ class UseCaseState(TypedDict, total=False):
     _audit_persisted_count: int
 
 
+# Per-key reducers declared via `Annotated[..., reducer]` above; other keys are overwritten.
+_REDUCERS: dict[str, Callable[[Any, Any], Any]] = {
+    key: hint.__metadata__[0]
+    for key, hint in get_type_hints(UseCaseState, include_extras=True).items()
+    if hasattr(hint, "__metadata__")
+}
+
+
+def apply_update(state: UseCaseState, update: Mapping[str, Any]) -> UseCaseState:
+    """
+    Fold a single node's partial update into a full state, mirroring LangGraph's reducers.
+
+    Used by the service layer when consuming `stream_mode="updates"`, where each chunk is a
+    node's delta rather than a full snapshot.
+    """
+
+    merged: dict[str, Any] = dict(state)
+    for key, value in update.items():
+        reducer = _REDUCERS.get(key)
+        merged[key] = reducer(merged.get(key), value) if reducer is not None else value
+    return merged  # type: ignore[return-value]
+
+
 # --- Module Notes -----------------------------------------------------------
 # This TypedDict is intentionally permissive (total=False) because LangGraph nodes may
 # stage internal/transient keys while still producing a valid persisted snapshot.
@@ -13,20 +13,21 @@ Responsibilities:
 from __future__ import annotations
 
 import uuid
+from itertools import islice
 from typing import Any
 
-import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from uca_orchestrator.cache import invalidate_use_case
 from uca_orchestrator.db.models import ArtifactType, RunStatus, UseCaseStatus
 from uca_orchestrator.db.repositories.artifacts import ArtifactRepo
 from uca_orchestrator.db.repositories.audit import AuditRepo
 from uca_orchestrator.db.repositories.runs import RunRepo
 from uca_orchestrator.db.repositories.use_cases import UseCaseRepo
-from uca_orchestrator.governance_clients.internal_http import InternalApiClient
+from uca_orchestrator.governance_clients.base import GovernanceClient
 from uca_orchestrator.orchestrator.graph import build_graph
 from uca_orchestrator.orchestrator.interrupts import HumanInterrupt
-from uca_orchestrator.orchestrator.state import UseCaseState
+from uca_orchestrator.orchestrator.state import UseCaseState, apply_update
 from uca_orchestrator.settings import Settings
 
 
@@ -36,11 +37,11 @@ class OrchestrationService:
         *,
         session: AsyncSession,
         settings: Settings,
-        http: httpx.AsyncClient,
+        client: GovernanceClient,
     ) -> None:
         self._session = session
         self._settings = settings
-        self._http = http
+        self._client = client
 
         self._use_cases = UseCaseRepo(session)
         self._runs = RunRepo(session)
@@ -87,8 +88,9 @@ class OrchestrationService:
             raise ValueError("use case not found")
 
         # Tools client boundary: the graph calls governance systems via this interface.
-        client = InternalApiClient(settings=self._settings, http=self._http)
-        graph = build_graph(client=client, max_attempts=self._settings.max_remediation_attempts)
+        graph = build_graph(
+            client=self._client, max_attempts=self._settings.max_remediation_attempts
+        )
 
         state: UseCaseState = dict(run.state or {})
         state["use_case_id"] = str(uc.id)
@@ -109,6 +111,8 @@ class OrchestrationService:
                 state=final_state,
             )
             await self._session.commit()
+            # Classification/artifacts just changed; drop cached firewall/netsec answers.
+            invalidate_use_case(uc.id)
             return {"status": "APPROVAL_READY", "run_id": str(run.id), "use_case_id": str(uc.id)}
         except HumanInterrupt as hi:
             # Use the last persisted checkpoint as the interruption snapshot.
@@ -192,7 +196,7 @@ class OrchestrationService:
         await self._runs.set_state(
             run_id=run_id,
             status=RunStatus.completed,
-            state=dict(state),
+            state=state,
             remediation_attempts=int(state.get("remediation_attempts", 0) or 0),
         )
         await self._use_cases.set_status(use_case_id, UseCaseStatus.approval_ready)
@@ -220,7 +224,7 @@ class OrchestrationService:
         await self._runs.set_state(
             run_id=run_id,
             status=RunStatus.interrupted,
-            state=dict(state),
+            state=state,
             remediation_attempts=int(state.get("remediation_attempts", 0) or 0),
             interrupted_reason=interrupt.reason,
             interrupted_payload=interrupt.payload,
@@ -261,20 +265,25 @@ class OrchestrationService:
         actor: str,
         state: UseCaseState,
     ) -> None:
-        entries = state.get("audit_log", [])
-        if not isinstance(entries, list):
-            return
+        # `audit_log` is always a sequence (append reducer); usually fully flushed already by
+        # the checkpoint loop, so return before building anything.
+        entries = state.get("audit_log") or ()
         start_idx = int(state.get("_audit_persisted_count", 0) or 0)
-        for entry in entries[start_idx:]:
-            if not isinstance(entry, dict):
-                continue
-            await self._audit.add(
-                use_case_id=use_case_id,
-                run_id=run_id,
-                actor="agent",
-                event_type=str(entry.get("event", "UNKNOWN")),
-                details=dict(entry.get("details", {})),
-            )
+        if start_idx >= len(entries):
+            return
+        await self._audit.add_many(
+            [
+                {
+                    "use_case_id": use_case_id,
+                    "run_id": run_id,
+                    "actor": "agent",
+                    "event_type": str(entry.get("event", "UNKNOWN")),
+                    "details": dict(entry.get("details", {})),
+                }
+                for entry in islice(entries, start_idx, None)
+                if isinstance(entry, dict)
+            ]
+        )
 
     async def _execute_with_checkpoints(
         self,
@@ -290,7 +299,19 @@ class OrchestrationService:
         """
 
         last_state: UseCaseState = dict(state)
-        persisted_audit_idx = 0
+        # Audit entries carried over from a previous execution (e.g. before a HITL resume)
+        # were already persisted by that execution.
+        persisted_audit_idx = len(last_state.get("audit_log", []))
+        # Checkpoints are written per node but committed in groups; callers commit the tail
+        # (success, interrupt and failure paths all end in a commit). SQLite always commits per
+        # node: an open write transaction would hold its single write lock across nodes and
+        # block the governance handlers' own writes (e.g. trigger_evaluations).
+        commit_every = (
+            1
+            if self._session.get_bind().dialect.name == "sqlite"
+            else self._settings.checkpoint_commit_every
+        )
+        nodes_since_commit = 0
 
         # Some LangGraph versions support astream; keep a fallback to ainvoke.
         if not hasattr(graph, "astream"):
@@ -300,37 +321,46 @@ class OrchestrationService:
             if not isinstance(update, dict) or not update:
                 continue
             node_name, node_state = next(iter(update.items()))
-            if isinstance(node_state, dict):
-                last_state = node_state  # already a full state snapshot in this stream mode
+            if not isinstance(node_state, dict) or not node_state:
+                # Node returned no delta (e.g. None): nothing new to checkpoint or audit.
+                continue
+            # Each chunk is the node's delta; fold it into the running full snapshot.
+            last_state = apply_update(last_state, node_state)
 
-            # Persist checkpoint (durable state snapshot).
-            remediation_attempts = int(last_state.get("remediation_attempts", 0) or 0)
+            # Persist newly appended audit entries incrementally for crash recovery / replay.
+            entries = last_state.get("audit_log", [])
+            if isinstance(entries, list):
+                # One batched INSERT per checkpoint for the node's new entries.
+                await self._audit.add_many(
+                    [
+                        {
+                            "use_case_id": use_case_id,
+                            "run_id": run_id,
+                            "actor": "agent",
+                            "event_type": str(entry.get("event", "UNKNOWN")),
+                            "details": {"node": node_name, **dict(entry.get("details", {}))},
+                        }
+                        for entry in entries[persisted_audit_idx:]
+                        if isinstance(entry, dict)
+                    ]
+                )
+                persisted_audit_idx = len(entries)
+
+            # Persist checkpoint (durable state snapshot). Written after the audit insert so
+            # the stored count covers it, and not mutated afterwards (`set_state` takes it
+            # without a copy; `apply_update` builds a new dict for the next node).
             last_state["_audit_persisted_count"] = persisted_audit_idx
             await self._runs.set_state(
                 run_id=run_id,
                 status=RunStatus.running,
-                state=dict(last_state),
-                remediation_attempts=remediation_attempts,
+                state=last_state,
+                remediation_attempts=int(last_state.get("remediation_attempts", 0) or 0),
                 error=None,
             )
-
-            # Persist newly appended audit entries incrementally for crash recovery / replay.
-            entries = last_state.get("audit_log", [])
-            if isinstance(entries, list):
-                for entry in entries[persisted_audit_idx:]:
-                    if not isinstance(entry, dict):
-                        continue
-                    await self._audit.add(
-                        use_case_id=use_case_id,
-                        run_id=run_id,
-                        actor="agent",
-                        event_type=str(entry.get("event", "UNKNOWN")),
-                        details={"node": node_name, **dict(entry.get("details", {}))},
-                    )
-                persisted_audit_idx = len(entries)
-                last_state["_audit_persisted_count"] = persisted_audit_idx
-
-            await self._session.commit()
+            nodes_since_commit += 1
+            if nodes_since_commit >= commit_every:
+                await self._session.commit()
+                nodes_since_commit = 0
 
         return last_state
 
@@ -7,15 +7,17 @@ Responsibilities:
 - Provide strongly-typed, env-driven settings for all layers.
 - Hide secrets from repr/logging (e.g., JWT secret).
 - Offer a cached settings instance for dependency injection.
+- Provide the request-scoped settings dependency (shared by the API and auth layers).
 """
 
 from __future__ import annotations
 
 from functools import lru_cache
-from typing import Literal
+from typing import Literal, cast
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from starlette.requests import Request
 
 
 class Settings(BaseSettings):
@@ -26,7 +28,12 @@ class Settings(BaseSettings):
     - Single settings object injected across layers
     """
 
-    model_config = SettingsConfigDict(env_prefix="UCA_", case_sensitive=False)
+    # Frozen: one cached instance is shared by every request, so it must not be mutated.
+    # defer_build: modules that import Settings only for annotations don't pay for the schema
+    # build; it happens on the first `Settings(...)` instead.
+    model_config = SettingsConfigDict(
+        env_prefix="UCA_", case_sensitive=False, frozen=True, defer_build=True
+    )
 
     # Environment controls toggle behavior like auto-init DB tables.
     env: Literal["dev", "test", "prod"] = "dev"
@@ -35,6 +42,9 @@ class Settings(BaseSettings):
 
     api_host: str = "0.0.0.0"
     api_port: int = 8080
+    # Uvicorn worker processes for `python -m uca_orchestrator.api` (one event loop each).
+    # Dev/test table auto-creation is not multi-worker safe on a fresh DB; keep 1 there.
+    api_workers: int = 1
 
     # Auth
     jwt_alg: str = "HS256"
@@ -44,20 +54,37 @@ class Settings(BaseSettings):
 
     # Persistence
     database_url: str = "sqlite+aiosqlite:///./uca.db"
+    # Connection pool sizing (ignored for SQLite, which uses SQLAlchemy's default pool).
+    db_pool_size: int = 25
+    db_max_overflow: int = 25
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
+    # Compiled-SQL LRU size per engine (SQLAlchemy default: 500).
+    db_query_cache_size: int = 1200
 
     # Dummy/internal API base url (used by orchestrator clients)
     internal_api_base_url: str = "http://localhost:8080"
 
     # Orchestrator
     max_remediation_attempts: int = 5
+    # Commit run checkpoints every N graph nodes (1 = every node). Larger values save commits
+    # (fsyncs) per run; a crash can then lose up to N-1 nodes of progress. Ignored for SQLite.
+    checkpoint_commit_every: int = Field(default=1, ge=1)
 
 
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    # Cache avoids re-parsing env vars for each request dependency.
+    # Cache avoids re-parsing env vars for each request dependency; all callers share one
+    # frozen instance.
     return Settings()
 
 
+async def settings_dep(request: Request) -> Settings:
+    # The settings the app was built with (`create_app` stores them on app.state): a plain
+    # attribute read, and async so FastAPI does not hop to the threadpool to call it.
+    return cast(Settings, request.app.state.settings)
+
+
 # --- Module Notes -----------------------------------------------------------
 # In a larger org this module often becomes a dependency for every other module;
 # keeping it stable (and well-versioned) reduces operational risk.
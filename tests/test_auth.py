@@ -0,0 +1,54 @@
+"""
+tests.test_auth
+
+Tests for the bearer-token authentication dependency.
+
+Responsibilities:
+- Ensure the validated-principal cache never outlives the token's `exp`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from uca_orchestrator.auth.deps import _jwt_cfg, get_principal
+from uca_orchestrator.auth.jwt import issue_token
+from uca_orchestrator.settings import Settings
+
+
+def _creds(token: str) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+@pytest.mark.asyncio
+async def test_cached_principal_expires_with_token() -> None:
+    settings = Settings(env="test")
+    cfg = _jwt_cfg(settings)
+    short = issue_token(
+        cfg=cfg, subject="alice", roles=["use_case_owner"], ttl=timedelta(seconds=1)
+    )
+
+    principal = await get_principal(_creds(short), settings)  # validated and cached
+    assert principal.subject == "alice"
+    assert await get_principal(_creds(short), settings) == principal  # served from the cache
+
+    # `exp` has whole-second resolution; wait until it has passed.
+    await asyncio.sleep(max(0.0, int(time.time()) + 2 - time.time()))
+    with pytest.raises(HTTPException) as exc_info:
+        await get_principal(_creds(short), settings)
+    assert exc_info.value.status_code == 401
+
+    fresh = issue_token(
+        cfg=cfg, subject="alice", roles=["use_case_owner"], ttl=timedelta(minutes=5)
+    )
+    assert (await get_principal(_creds(fresh), settings)).subject == "alice"
+
+
+# --- Module Notes -----------------------------------------------------------
+# Calls the dependency directly (no app): the cache is module state, keyed per token digest.
@@ -0,0 +1,38 @@
+"""
+tests.test_cache
+
+Unit tests for the in-process TTL cache.
+
+Responsibilities:
+- Ensure a fill that started before an invalidation does not store its stale value.
+"""
+
+from __future__ import annotations
+
+from uca_orchestrator.cache import TTLCache, invalidate_use_case
+
+
+def test_fill_started_before_invalidation_is_not_stored() -> None:
+    cache: TTLCache[str, str] = TTLCache(ttl_s=30.0, maxsize=2)
+
+    generation = cache.generation("uc-1")
+    invalidate_use_case("uc-1")  # a writer commits while the fill is reading
+    cache.set("uc-1", "stale", generation=generation)
+    assert cache.get("uc-1") is None
+
+    generation = cache.generation("uc-1")
+    cache.set("uc-1", "fresh", generation=generation)
+    assert cache.get("uc-1") == "fresh"
+
+
+def test_generation_table_overflow_skips_in_flight_fills() -> None:
+    cache: TTLCache[str, str] = TTLCache(ttl_s=30.0, maxsize=2)
+    generation = cache.generation("uc-1")
+    for key in ("a", "b", "c"):  # third distinct key clears the table and bumps the epoch
+        cache.invalidate(key)
+    cache.set("uc-1", "stale", generation=generation)
+    assert cache.get("uc-1") is None
+
+
+# --- Module Notes -----------------------------------------------------------
+# Each test builds its own cache; instances register globally but never share keys.
@@ -0,0 +1,59 @@
+"""
+tests.test_middleware
+
+Tests for the request-context ASGI middleware.
+
+Responsibilities:
+- Ensure every response carries exactly one `x-request-id` header.
+- Ensure a caller-provided request id is echoed back.
+"""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from uca_orchestrator.observability.middleware import RequestContextMiddleware
+
+
+async def _plain(_: Request) -> PlainTextResponse:
+    return PlainTextResponse("ok")
+
+
+async def _sets_own_id(_: Request) -> PlainTextResponse:
+    return PlainTextResponse("ok", headers={"X-Request-ID": "from-route"})
+
+
+def _client() -> httpx.AsyncClient:
+    app = Starlette(routes=[Route("/plain", _plain), Route("/own-id", _sets_own_id)])
+    transport = httpx.ASGITransport(app=RequestContextMiddleware(app))
+    return httpx.AsyncClient(transport=transport, base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_response_has_single_request_id() -> None:
+    async with _client() as client:
+        r = await client.get("/plain")
+        generated = r.headers.get_list("x-request-id")
+        assert len(generated) == 1 and len(generated[0]) == 36
+
+        # A header set by the route is replaced, not duplicated.
+        r = await client.get("/own-id")
+        assert r.headers.get_list("x-request-id") != ["from-route"]
+        assert len(r.headers.get_list("x-request-id")) == 1
+
+
+@pytest.mark.asyncio
+async def test_inbound_request_id_is_echoed() -> None:
+    async with _client() as client:
+        for path in ("/plain", "/own-id"):
+            r = await client.get(path, headers={"x-request-id": "abc-123"})
+            assert r.headers.get_list("x-request-id") == ["abc-123"]
+
+
+# --- Module Notes -----------------------------------------------------------
+# Uses a bare Starlette app so the middleware is tested without the DB-backed lifespan.
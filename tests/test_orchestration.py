@@ -0,0 +1,162 @@
+"""
+tests.test_orchestration
+
+End-to-end orchestration tests through the public API, on a throwaway SQLite database.
+
+Responsibilities:
+- Ensure register -> orchestrate persists status, artifacts and one audit row per graph event.
+- Ensure an interrupted run can be resumed without re-persisting audit rows already written.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import httpx
+import pytest
+
+from uca_orchestrator.api.app import create_app
+from uca_orchestrator.settings import Settings
+
+_PCI_PAYLOAD = {
+    "data_classification": "PCI",
+    "deployment_target": "CLOUD",
+    "model_provider": "EXTERNAL",
+}
+
+# Events emitted once per graph pass, from entry up to the eval/approval decision.
+_PASS_EVENTS = (
+    "ENTRY",
+    "CLASSIFY",
+    "FETCH_REGISTRATION",
+    "FETCH_POLICY",
+    "FETCH_APPROVALS",
+    "FETCH_EVAL_STATUS",
+    "FETCH_ARTIFACT_STATUS",
+    "GAP_ANALYSIS",
+)
+
+
+@asynccontextmanager
+async def _client(tmp_path: Path) -> AsyncIterator[httpx.AsyncClient]:
+    db_url = f"sqlite+aiosqlite:///{tmp_path / 'orchestration.db'}"
+    app = create_app(settings=Settings(env="test", database_url=db_url))
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            yield client
+
+
+async def _auth(client: httpx.AsyncClient, subject: str, roles: list[str]) -> dict[str, str]:
+    r = await client.post("/v1/dev/token", json={"subject": subject, "roles": roles})
+    assert r.status_code == 200, r.text
+    return {"Authorization": f"Bearer {r.json()['access_token']}"}
+
+
+async def _register_and_orchestrate(
+    client: httpx.AsyncClient, owner: dict[str, str]
+) -> tuple[str, dict[str, object]]:
+    r = await client.post(
+        "/v1/use-cases/register", headers=owner, json={"submission_payload": _PCI_PAYLOAD}
+    )
+    assert r.status_code == 200, r.text
+    use_case_id = r.json()["use_case_id"]
+    r = await client.post(f"/v1/use-cases/{use_case_id}/orchestrate", headers=owner)
+    assert r.status_code == 200, r.text
+    return use_case_id, r.json()
+
+
+async def _audit_counts(
+    client: httpx.AsyncClient, owner: dict[str, str], use_case_id: str
+) -> Counter[str]:
+    r = await client.get(f"/v1/use-cases/{use_case_id}/audit", headers=owner)
+    assert r.status_code == 200, r.text
+    return Counter(e["event_type"] for e in r.json())
+
+
+@pytest.mark.asyncio
+async def test_register_orchestrate_persists_snapshot_artifacts_and_audit(tmp_path: Path) -> None:
+    async with _client(tmp_path) as client:
+        owner = await _auth(client, "alice", ["use_case_owner"])
+        use_case_id, result = await _register_and_orchestrate(client, owner)
+        assert result["status"] == "APPROVAL_READY"
+
+        r = await client.get(f"/v1/use-cases/{use_case_id}", headers=owner)
+        assert r.status_code == 200, r.text
+        uc = r.json()
+        assert uc["status"] == "APPROVAL_READY"
+        assert uc["risk_level"] == "HIGH"
+        assert uc["classification"] == _PCI_PAYLOAD
+        assert uc["missing_artifacts"] == []
+
+        r = await client.get(f"/v1/use-cases/{use_case_id}/artifacts", headers=owner)
+        assert r.status_code == 200, r.text
+        assert sorted(a["type"] for a in r.json()) == [
+            "AI_FIREWALL_RULES",
+            "REDACTION_PLAN",
+            "THREAT_MODEL",
+        ]
+
+        # One row per event: checkpoint flushes must not persist an entry twice.
+        assert await _audit_counts(client, owner, use_case_id) == Counter(
+            {
+                "USE_CASE_REGISTERED": 1,
+                "RUN_CREATED": 1,
+                **dict.fromkeys(_PASS_EVENTS, 1),
+                "ARTIFACT_GENERATION": 1,
+                "EVAL_TRIGGERED": 1,
+                "EVAL_OK": 1,
+                "APPROVAL_OK": 1,
+                "FINISH": 1,
+            }
+        )
+
+
+@pytest.mark.asyncio
+async def test_resume_does_not_duplicate_audit_rows(tmp_path: Path) -> None:
+    async with _client(tmp_path) as client:
+        owner = await _auth(client, "alice", ["use_case_owner"])
+        reviewer = await _auth(client, "rev", ["governance_reviewer"])
+        internal = await _auth(client, "svc", ["internal_system"])
+        use_case_id, _ = await _register_and_orchestrate(client, owner)
+        first_run = await _audit_counts(client, owner, use_case_id)
+
+        # Re-triggered evaluations on a PCI use case fail toxicity, so the next run remediates
+        # and escalates to a human (HIGH risk).
+        r = await client.post(
+            f"/internal/v1/evaluations/{use_case_id}/trigger",
+            headers=internal,
+            json={"evaluations": ["TOXICITY", "PROMPT_INJECTION"]},
+        )
+        assert r.status_code == 200, r.text
+        r = await client.post(f"/v1/use-cases/{use_case_id}/orchestrate", headers=owner)
+        assert r.status_code == 200, r.text
+        interrupted = r.json()
+        assert interrupted["status"] == "INTERRUPTED"
+
+        r = await client.post(
+            f"/v1/runs/{interrupted['run_id']}/resume",
+            headers=reviewer,
+            json={"decision": {"approve": True}},
+        )
+        assert r.status_code == 200, r.text
+        assert r.json()["status"] == "INTERRUPTED"
+
+        # Two more graph passes (interrupted run + resume), each auditing its events once.
+        failing_pass = Counter(
+            {
+                **dict.fromkeys(_PASS_EVENTS, 1),
+                "EVAL_FAILED": 1,
+                "REMEDIATION_PLANNED": 1,
+                "HITL_INTERRUPT": 1,
+            }
+        )
+        expected = first_run + failing_pass + failing_pass + Counter({"RUN_RESUMED": 1})
+        assert await _audit_counts(client, owner, use_case_id) == expected
+
+
+# --- Module Notes -----------------------------------------------------------
+# Governance systems are the in-process dummies, so outcomes are deterministic per payload.
@@ -9,6 +9,8 @@ Responsibilities:
 
 from __future__ import annotations
 
+import asyncio
+
 import httpx
 import pytest
 
@@ -21,20 +23,17 @@ async def test_health_endpoints() -> None:
     app = create_app(settings=Settings(env="test"))
 
     # httpx 0.28 ASGITransport does not manage lifespan automatically; do it explicitly.
-    await app.router.startup()
-    try:
+    async with app.router.lifespan_context(app):
         transport = httpx.ASGITransport(app=app)
         async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
-            r = await client.get("/healthz")
-            assert r.status_code == 200
-            assert r.json()["status"] == "ok"
+            # Independent probes: issue them concurrently (also exercises concurrent dispatch).
+            r_health, r_ready = await asyncio.gather(client.get("/healthz"), client.get("/readyz"))
+            assert r_health.status_code == 200
+            assert r_health.json()["status"] == "ok"
 
-            r = await client.get("/readyz")
-            assert r.status_code == 200
-            assert r.json()["status"] == "ready"
-    finally:
-        await app.router.shutdown()
+            assert r_ready.status_code == 200
+            assert r_ready.json()["status"] == "ready"
 
 
 # --- Module Notes -----------------------------------------------------------
-# Add higher-level integration tests once orchestration endpoints are exercised with real fixtures.
+# Orchestration flows (register -> orchestrate -> resume) live in `tests.test_orchestration`.